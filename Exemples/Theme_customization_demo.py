@@ -168,12 +168,8 @@ class ThemeCustomizationDemo:
             # Validate the color
             self.root.winfo_rgb(color_value)
             
-            # Update the theme's color
-            current_theme = self.theme.current_theme
-            TKMT.THEMES[current_theme][color_type] = color_value
-            
-            # Reapply the theme to see changes
-            self.theme.set_theme(current_theme)
+            # Update the theme's color and reapply it
+            self.theme.update_theme_colors(**{color_type: color_value})
             
         except tk.TclError:
             # Invalid color, show error
@@ -185,12 +181,7 @@ class ThemeCustomizationDemo:
     
     def reset_theme(self):
         """Reset to the original theme colors"""
-        current_theme = self.theme.current_theme
-        for key, value in self.original_theme.items():
-            TKMT.THEMES[current_theme][key] = value
-        
-        # Reapply the theme
-        self.theme.set_theme(current_theme)
+        self.theme.update_theme_colors(**self.original_theme)
         
         # Update the color variables
         self.bg_color_var.set(self.original_theme['bg'])
@@ -0,0 +1,645 @@
+"""
+Animation helpers for TkModernThemes
+
+All animations of a Tcl interpreter are driven by one AnimationScheduler:
+a single timer firing at the target frame rate that advances every active
+animation and applies the property updates of a frame together, one
+configure() per widget. Its Tcl command is registered once, where
+widget.after() registers and deletes one per step, and the timer stops
+while nothing is animating.
+
+An animation is keyed by (widget, property): starting another one on the
+same key replaces the running one, and animate_widget continues from the
+value shown so far instead of jumping back to start_value. Animations of
+a widget are cancelled when it is destroyed.
+
+Every animation and every scheduler keep FrameStats: the actual time
+between frames, late frames (more than LATE_FRAME_FACTOR frame budgets
+apart) and the overrun of finished animations past their requested
+duration. Read them from Animation.stats and AnimationScheduler.stats,
+or set AnimationScheduler.on_late_frame to be told about each late frame.
+
+animate_theme_transition() runs on the same clock. It fills a scratch ttk
+theme with the current theme's styles and, each frame, rewrites only the
+style rows that read a color token differing between the two themes, in
+one Tcl script. Frames are chosen by elapsed time, so on a slow machine
+the frames that would overrun are dropped and the transition still ends
+on time, with a regular set_theme of the new theme.
+"""
+
+import time
+import tkinter as tk
+import weakref
+from collections import deque
+from functools import lru_cache
+
+from . import THEMES
+from .colors import format_hex, is_color, normalize_theme, to_hex
+from .easing import easing_table
+from .engine import (_TTK_THEME_PREFIX, _CompiledTheme, _compile_settings,
+                     _removed_rows, _settings_from_table)
+from .palette import gradient
+from .styles import dependent_rows, resolve_style_table
+
+__all__ = ["DEFAULT_FPS", "LATE_FRAME_FACTOR", "FrameStats", "Animation",
+           "AnimationScheduler", "ThemeTransition", "scheduler_for",
+           "cancel_animations", "animation_stats", "animate_widget",
+           "animate_theme_transition"]
+
+DEFAULT_FPS = 60
+
+# A frame is late when it comes more than this many frame budgets
+# (1 / fps) after the previous one
+LATE_FRAME_FACTOR = 1.5
+
+
+class FrameStats:
+    """Frame timing of one animation, or of all animations of a scheduler"""
+
+    def __init__(self, max_samples=1000):
+        """
+        Args:
+            max_samples: Number of recent frame intervals kept for
+                percentiles
+        """
+        self.frames = 0
+        self.late_frames = 0
+        self.dropped_frames = 0  # frame slots skipped by late frames
+        self.total_interval = 0.0  # ms between frames, summed
+        self.max_interval = 0.0  # ms
+        self.animations = 0  # animations finished
+        self.total_overrun = 0.0  # ms past the requested durations, summed
+        self.max_overrun = 0.0  # ms
+        self._intervals = 0  # frames that followed another frame
+        self._samples = deque(maxlen=max_samples)
+        self._last_frame = None
+
+    @property
+    def mean_interval(self):
+        """Mean time between frames in milliseconds, or None"""
+        return self.total_interval / self._intervals if self._intervals else None
+
+    def percentile(self, percent):
+        """
+        Return a percentile of the recent frame intervals
+
+        Args:
+            percent: Percentile, 0 to 100
+
+        Returns:
+            Interval in milliseconds, or None without samples
+        """
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    def record_frame(self, now, frame_budget):
+        """
+        Record a frame
+
+        Args:
+            now: time.perf_counter() value of the frame
+            frame_budget: Target milliseconds between frames
+
+        Returns:
+            The interval since the previous frame in milliseconds if the
+            frame is late, otherwise None
+        """
+        self.frames += 1
+        last, self._last_frame = self._last_frame, now
+        if last is None:
+            return None
+        interval = (now - last) * 1000
+        self._intervals += 1
+        self.total_interval += interval
+        self.max_interval = max(self.max_interval, interval)
+        self._samples.append(interval)
+        if interval <= frame_budget * LATE_FRAME_FACTOR:
+            return None
+        self.late_frames += 1
+        self.dropped_frames += max(1, round(interval / frame_budget) - 1)
+        return interval
+
+    def record_finish(self, requested, actual):
+        """
+        Record a finished animation
+
+        Args:
+            requested: Requested duration in milliseconds
+            actual: Time from start to the last frame in milliseconds
+        """
+        overrun = max(0.0, actual - requested)
+        self.animations += 1
+        self.total_overrun += overrun
+        self.max_overrun = max(self.max_overrun, overrun)
+
+    def pause(self):
+        """Do not count the time until the next frame as an interval"""
+        self._last_frame = None
+
+    def reset(self):
+        """Clear all recorded data"""
+        self.__init__(self._samples.maxlen)
+
+    def as_dict(self):
+        """
+        Get the statistics as plain data
+
+        Returns:
+            Dictionary with frames, late_frames, dropped_frames,
+            mean_interval, p95_interval, max_interval, animations,
+            total_overrun and max_overrun (times in milliseconds)
+        """
+        return {
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "dropped_frames": self.dropped_frames,
+            "mean_interval": self.mean_interval,
+            "p95_interval": self.percentile(95),
+            "max_interval": self.max_interval,
+            "animations": self.animations,
+            "total_overrun": self.total_overrun,
+            "max_overrun": self.max_overrun,
+        }
+
+
+class Animation:
+    """One widget property animated through precomputed values"""
+
+    def __init__(self, widget, property_name, values, duration):
+        """
+        Args:
+            widget: The widget to animate, or any object with a
+                configure(**options) method
+            property_name: The configure() option to animate
+            values: Value of each step, first to last
+            duration: Duration of the animation in milliseconds
+        """
+        self.widget = widget
+        self.property_name = property_name
+        self.values = values
+        self.duration = duration / 1000
+        self.start_time = None  # set when added to a scheduler
+        self.last_value = None  # value applied by the last frame
+        self.finished = False
+        self.cancelled = False
+        self.stats = FrameStats()
+
+    @property
+    def key(self):
+        """Animations with equal keys replace each other"""
+        return (self.widget, self.property_name)
+
+    def current_value(self):
+        """Return the value shown by the last frame, or the first value"""
+        return self.values[0] if self.last_value is None else self.last_value
+
+    def value_at(self, now):
+        """
+        Return the value to show at a time
+
+        Args:
+            now: time.perf_counter() value
+
+        Returns:
+            (value, last) tuple; last is True once the final step is due
+        """
+        last_step = len(self.values) - 1
+        if self.duration <= 0:
+            return self.values[last_step], True
+        step = int((now - self.start_time) / self.duration * last_step)
+        if step >= last_step:
+            return self.values[last_step], True
+        return self.values[step], False
+
+
+class AnimationScheduler:
+    """Frame clock shared by every animation of one Tcl interpreter"""
+
+    def __init__(self, tk_root, fps=DEFAULT_FPS):
+        self.tk = tk_root.tk
+        self.fps = fps
+        self.animations = []  # active Animations, in start order
+        self.frames = 0  # frames run so far
+        self._running = {}  # animation key -> active Animation
+        self._watched = weakref.WeakSet()  # widgets with a <Destroy> binding
+        self.stats = FrameStats()  # all frames and animations
+        self.on_late_frame = None  # called with the interval (ms) of late frames
+        # Kept for every frame. Only the interpreter is stored: the command
+        # is deleted with tk_root, which then frees the _schedulers entry
+        self._command = tk_root.register(self._tick)
+        self._after_id = None
+        self._next_frame = None
+
+    def running(self, widget, property_name):
+        """Return the active Animation of a widget property, or None"""
+        return self._running.get((widget, property_name))
+
+    def add(self, animation):
+        """
+        Start an animation on the next frame
+
+        An active animation with the same key is cancelled.
+
+        Args:
+            animation: Animation to run
+
+        Returns:
+            The animation
+        """
+        previous = self._running.get(animation.key)
+        if previous is not None:
+            self._remove(previous)
+        self._watch(animation.widget)
+        animation.start_time = time.perf_counter()
+        self.animations.append(animation)
+        self._running[animation.key] = animation
+        if self._after_id is None:
+            # First frame right away, then one every 1 / fps seconds
+            self.stats.pause()
+            self._next_frame = animation.start_time
+            self._after_id = self.tk.call("after", 0, self._command)
+        return animation
+
+    def cancel(self, animation):
+        """Stop an animation, leaving its property at the current value"""
+        self._remove(animation)
+        if not self.animations:
+            self.stop()
+
+    def cancel_widget(self, widget):
+        """
+        Stop every animation of a widget
+
+        Args:
+            widget: The animated widget
+
+        Returns:
+            Number of animations cancelled
+        """
+        animations = [animation for animation in self.animations
+                      if animation.widget is widget]
+        for animation in animations:
+            self.cancel(animation)
+        return len(animations)
+
+    def stop(self):
+        """Stop every animation and the frame timer"""
+        for animation in self.animations:
+            animation.cancelled = True
+        self.animations = []
+        self._running = {}
+        if self._after_id is not None:
+            self.tk.call("after", "cancel", self._after_id)
+            self._after_id = None
+
+    def _remove(self, animation):
+        if animation in self.animations:
+            self.animations.remove(animation)
+            animation.cancelled = True
+        if self._running.get(animation.key) is animation:
+            del self._running[animation.key]
+
+    def _watch(self, widget):
+        """Cancel the animations of a Tk widget when it is destroyed"""
+        if widget in self._watched or not hasattr(widget, "bind"):
+            return
+        self._watched.add(widget)
+
+        def on_destroy(event):
+            # Toplevels also receive the <Destroy> events of their children
+            if event.widget is widget:
+                self.cancel_widget(widget)
+
+        widget.bind("<Destroy>", on_destroy, add="+")
+
+    def _schedule(self):
+        interval = 1 / self.fps
+        now = time.perf_counter()
+        self._next_frame += interval
+        if self._next_frame < now:
+            # A frame overran: start counting again rather than firing
+            # the missed frames back to back
+            self._next_frame = now + interval
+        delay = max(1, round((self._next_frame - now) * 1000))
+        self._after_id = self.tk.call("after", delay, self._command)
+
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+        frame_budget = 1000 / self.fps
+        late = self.stats.record_frame(now, frame_budget)
+        if late is not None and self.on_late_frame is not None:
+            self.on_late_frame(late)
+
+        updates = {}  # widget -> {property: value} of this frame
+        running = []
+        for animation in self.animations:
+            animation.stats.record_frame(now, frame_budget)
+            value, last = animation.value_at(now)
+            if value != animation.last_value:
+                animation.last_value = value
+                updates.setdefault(animation.widget, {})[animation.property_name] = value
+            if last:
+                animation.finished = True
+                del self._running[animation.key]
+                requested = animation.duration * 1000
+                actual = (now - animation.start_time) * 1000
+                animation.stats.record_finish(requested, actual)
+                self.stats.record_finish(requested, actual)
+            else:
+                running.append(animation)
+        self.animations = running
+
+        for widget, options in updates.items():
+            try:
+                widget.configure(**options)
+            except tk.TclError:
+                # The widget was destroyed while animating
+                self.cancel_widget(widget)
+        self.frames += 1
+        if self.animations:
+            self._schedule()
+
+
+# Keyed by the Tk instance that owns the interpreter, like the theme engines
+_schedulers = weakref.WeakKeyDictionary()
+
+
+def scheduler_for(widget):
+    """Return the animation scheduler of the interpreter widget belongs to"""
+    tk_root = widget._root()
+    scheduler = _schedulers.get(tk_root)
+    if scheduler is None or scheduler.tk is not tk_root.tk:
+        scheduler = _schedulers[tk_root] = AnimationScheduler(tk_root)
+    return scheduler
+
+
+def animation_stats(widget):
+    """
+    Return the frame statistics of every animation in a widget's interpreter
+
+    Args:
+        widget: Any widget of the interpreter
+
+    Returns:
+        The scheduler's FrameStats
+    """
+    return scheduler_for(widget).stats
+
+
+def cancel_animations(widget):
+    """
+    Stop every animation of a widget, leaving its properties as shown
+
+    Args:
+        widget: The animated widget
+
+    Returns:
+        Number of animations cancelled
+    """
+    return scheduler_for(widget).cancel_widget(widget)
+
+
+def _eased_steps(easing, steps):
+    """Step index of each frame of an eased lookup table animation"""
+    return tuple(min(steps, max(0, round(progress * steps)))
+                 for progress in easing_table(easing, steps))
+
+
+@lru_cache(maxsize=256)
+def _color_values(start, end, steps, color_space, easing):
+    """Colors of every step of an eased color animation"""
+    colors = gradient(start, end, steps, color_space)
+    if easing == "linear":
+        return colors
+    # Overshooting curves are clamped to the two colors
+    return tuple(colors[index] for index in _eased_steps(easing, steps))
+
+
+def _widget_color(widget, value):
+    """Resolve a Tk color name ("white", "SystemButtonFace") to #rrggbb"""
+    if not isinstance(value, str) or is_color(value):
+        return value
+    try:
+        red, green, blue = widget.winfo_rgb(value)
+    except (AttributeError, tk.TclError):
+        raise ValueError(f"Cannot animate {value!r}: not a number or a color") from None
+    return format_hex((red >> 8, green >> 8, blue >> 8))
+
+
+def animate_widget(widget, property_name, start_value, end_value, duration=500, steps=50,
+                   color_space="oklab", retarget=True, easing="linear"):
+    """
+    Animate a widget property from start_value to end_value
+
+    Numbers are interpolated directly. Colors (any format colors.py
+    parses, or a Tk color name such as the "SystemButtonFace" that
+    cget("background") may return) are interpolated through a lookup
+    table of #rrggbb strings built once per (start, end, steps,
+    color_space, easing), so each frame only indexes into it.
+
+    Args:
+        widget: The widget to animate
+        property_name: The property to animate (e.g., 'background', 'alpha')
+        start_value: Starting value
+        end_value: Ending value
+        duration: Duration of animation in milliseconds
+        steps: Number of steps in the animation
+        color_space: "oklab" (perceptually even) or "rgb", for colors
+        retarget: If the property is already animating, start from the
+            value it shows now rather than from start_value
+        easing: Name of a curve in easing.EASINGS (e.g. "ease_out_cubic",
+            "spring") or a callable mapping 0-1 to the progress
+
+    Returns:
+        The Animation, run by the interpreter's AnimationScheduler; it
+        replaces any running animation of the same widget property
+
+    Raises:
+        ValueError: If a string value is not a color the widget knows
+    """
+    scheduler = scheduler_for(widget)
+    running = scheduler.running(widget, property_name)
+    if retarget and running is not None:
+        start_value = running.current_value()
+    start_value = _widget_color(widget, start_value)
+    end_value = _widget_color(widget, end_value)
+    if is_color(start_value) and is_color(end_value):
+        values = _color_values(start_value, end_value, steps, color_space, easing)
+    else:
+        distance = end_value - start_value
+        values = [start_value + distance * progress
+                  for progress in easing_table(easing, steps)]
+    animation = Animation(widget, property_name, values, duration)
+    return scheduler.add(animation)
+
+
+# ttk theme showing the in-between frames of theme transitions
+_TRANSITION_THEME = _TTK_THEME_PREFIX + "_transition"
+
+
+class ThemeTransition(Animation):
+    """Animated switch of a ThemedTk to another theme"""
+
+    def __init__(self, theme_manager, new_theme_name, duration, steps,
+                 color_space="oklab", previous=None, easing="linear"):
+        """
+        Args:
+            theme_manager: The ThemedTk instance, showing a theme
+            new_theme_name: Name of the theme to switch to
+            duration: Duration of the transition in milliseconds
+            steps: Number of color steps
+            color_space: "oklab" or "rgb", see palette.gradient
+            previous: Running transition of the same manager to take over
+                from its current frame
+            easing: Easing curve of the colors, see easing.EASINGS
+        """
+        super().__init__(self, "step", range(steps + 1), duration)
+        self.theme_manager = theme_manager
+        self.new_theme_name = new_theme_name
+        self.previous = previous
+        self.rendered = 0  # frames drawn
+        self.dropped = 0  # steps skipped because a frame was late
+
+        if previous is not None:
+            start = previous.colors
+        else:
+            start = normalize_theme(theme_manager.get_theme_colors())
+        end = normalize_theme(THEMES[new_theme_name])
+        # Only color tokens are interpolated; the others (fonts, radius)
+        # change with the final set_theme
+        self.gradients = {
+            token: gradient(start[token], end[token], steps, color_space)
+            for token in start
+            if token in end and start[token] != end[token]
+            and is_color(start[token]) and is_color(end[token])}
+        self.start_colors = start
+        self.colors = start  # normalized tokens of the last frame
+        self._color_steps = _eased_steps(easing, steps)  # frame -> gradient index
+        self.rows = dependent_rows(self.gradients)
+        self._shown = {}  # row -> value held by the transition theme
+        self._held = {}  # every row the transition theme holds
+        self._step = None
+
+    @property
+    def key(self):
+        """One transition runs per theme manager"""
+        return (self.theme_manager, "theme")
+
+    def begin(self):
+        """Show the current theme through the transition ttk theme"""
+        manager = self.theme_manager
+        if self.previous is not None:
+            # The transition theme is shown already, at the previous frame
+            self._shown = dict(self.previous._shown)
+            self._held = self.previous._held
+            self.previous = None
+            return
+        compiled = manager._compiled_themes[_TTK_THEME_PREFIX + manager.current_theme]
+        self._shown = {key: compiled.table[key] for key in self.rows
+                       if key in compiled.table}
+        settings = dict(compiled.table)
+        filled = manager._compiled_themes.get(_TRANSITION_THEME)
+        if filled is not None:
+            # Reset what an earlier transition from another theme left
+            settings.update(_removed_rows(filled.table, compiled.table))
+        manager.style.tk.eval(_compile_settings(
+            _TRANSITION_THEME, _settings_from_table(settings)))
+        self._held = dict(compiled.table)
+        manager._compiled_themes[_TRANSITION_THEME] = _CompiledTheme(
+            _TRANSITION_THEME, None, self._held)
+        manager.style.theme_use(_TRANSITION_THEME)
+
+    def configure(self, step):
+        """Draw one frame; called by the AnimationScheduler"""
+        if self.theme_manager.style.theme_use() != _TRANSITION_THEME:
+            # set_theme was called meanwhile; it wins
+            scheduler_for(self.theme_manager.root).cancel(self)
+            return
+        if self._step is not None and step > self._step + 1:
+            self.dropped += step - self._step - 1
+        self._step = step
+        self.rendered += 1
+        if step == len(self.values) - 1:
+            self.theme_manager.set_theme(self.new_theme_name)
+            return
+
+        colors = dict(self.start_colors)
+        index = self._color_steps[step]
+        for token, values in self.gradients.items():
+            colors[token] = values[index]
+        self.colors = colors
+        changed = {key: value
+                   for key, value in resolve_style_table(colors, self.rows).items()
+                   if self._shown.get(key) != value}
+        if changed:
+            self.theme_manager.style.tk.eval(_compile_settings(
+                _TRANSITION_THEME, _settings_from_table(changed), create=False))
+            self._shown.update(changed)
+            self._held.update(changed)
+        if "bg" in self.gradients:
+            self.theme_manager.root.configure(bg=to_hex(colors["bg"]))
+            # The root no longer shows the theme's bg, even if set_theme
+            # is called again with the theme it started from
+            self.theme_manager._root_theme = None
+
+
+def animate_theme_transition(theme_manager, new_theme_name, duration=500,
+                             steps=None, color_space="oklab", easing="linear"):
+    """
+    Animate the transition between themes
+
+    The color tokens that differ between the current and the new theme
+    are interpolated; each frame applies one style update for the rows
+    reading them. The transition ends with set_theme(new_theme_name). If
+    no theme is shown yet, or no color differs, it switches right away.
+    A transition started while another one runs on the same manager
+    replaces it and continues from the colors shown.
+
+    Args:
+        theme_manager: The ThemedTk instance
+        new_theme_name: Name of the new theme
+        duration: Duration of the transition in milliseconds
+        steps: Number of color steps (default: one per frame at the
+            scheduler's frame rate)
+        color_space: "oklab" (perceptually even) or "rgb"
+        easing: Name of a curve in easing.EASINGS or a callable
+
+    Returns:
+        The ThemeTransition, or None if the theme was switched right away
+
+    Raises:
+        ValueError: If theme name is not found
+    """
+    if new_theme_name not in THEMES:
+        available = ", ".join(THEMES.keys())
+        raise ValueError(
+            f"Theme '{new_theme_name}' not found. Available themes: {available}")
+    scheduler = scheduler_for(theme_manager.root)
+    running = scheduler.running(theme_manager, "theme")
+    current = theme_manager.current_theme
+    if current is None or (current == new_theme_name and running is None):
+        theme_manager.set_theme(new_theme_name)
+        return None
+
+    if running is None:
+        # Bring the ttk theme of the current theme up to date; its table
+        # is the first frame
+        theme_manager.set_theme(current)
+    # Build the new theme now, so the final switch is a theme_use
+    theme_manager._compile_theme(new_theme_name, THEMES[new_theme_name])
+
+    if steps is None:
+        steps = max(1, round(duration / 1000 * scheduler.fps))
+    transition = ThemeTransition(theme_manager, new_theme_name, duration,
+                                 steps, color_space, previous=running,
+                                 easing=easing)
+    if not transition.gradients:
+        if running is not None:
+            scheduler.cancel(running)
+        theme_manager.set_theme(new_theme_name)
+        return None
+    transition.begin()
+    return scheduler.add(transition)
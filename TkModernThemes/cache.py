@@ -0,0 +1,90 @@
+"""
+On-disk cache location and helpers for TkModernThemes
+
+The cache lives in $TKMT_CACHE_DIR if set, otherwise in the platform
+cache directory (%LOCALAPPDATA%, ~/Library/Caches or $XDG_CACHE_HOME)
+under "TkModernThemes". Set TKMT_CACHE_DIR to an empty string to disable
+it. Cache files are only an optimization: unreadable or unwritable files
+are ignored. json and tempfile are imported on first use to keep them
+out of the package import.
+"""
+
+import os
+import sys
+
+__all__ = ["cache_dir", "read_json", "write_json"]
+
+
+def cache_dir():
+    """
+    Return the cache directory, or None if caching is disabled
+
+    Returns:
+        Directory path (not necessarily existing yet) or None
+    """
+    path = os.environ.get("TKMT_CACHE_DIR")
+    if path is not None:
+        return path or None
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "TkModernThemes")
+
+
+def read_json(name):
+    """
+    Read a JSON cache file
+
+    Args:
+        name: File name inside the cache directory
+
+    Returns:
+        Decoded data, or None if the file is missing or unreadable
+    """
+    import json
+
+    directory = cache_dir()
+    if directory is None:
+        return None
+    try:
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(name, data):
+    """
+    Atomically write a JSON cache file
+
+    Args:
+        name: File name inside the cache directory (may include
+            subdirectories)
+        data: JSON-serializable data
+
+    Returns:
+        True if the file was written
+    """
+    import json
+    import tempfile
+
+    directory = cache_dir()
+    if directory is None:
+        return False
+    path = os.path.join(directory, name)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,197 @@
+"""
+Lazy theme catalog for TkModernThemes
+
+THEMES is a ThemeCatalog: a mapping of theme name to token dictionary
+that only keeps a lightweight index (name, display name, dark/light,
+file location) until a theme's tokens are actually requested. Listing,
+membership tests and len() never load a theme; indexing does, once.
+
+Usage:
+    TKMT.THEMES.add_directory("themes/")  # index only
+    [entry.display_name for entry in TKMT.THEMES.entries() if entry.dark]
+    TKMT.THEMES["brand_dark"]             # loads and validates the file
+"""
+
+import os
+from collections import namedtuple
+from collections.abc import MutableMapping
+
+from .cache import read_json, write_json
+from .colors import is_color
+from .palette import is_dark_color
+
+__all__ = ["ThemeEntry", "ThemeCatalog"]
+
+ThemeEntry = namedtuple("ThemeEntry", ["name", "display_name", "dark", "path"])
+
+# Index of the built-in themes of .themes: name -> (display name, dark)
+BUILTIN_INDEX = {
+    "cyberpunk": ("Cyberpunk", True),
+    "minimal_zen": ("Minimal Zen", False),
+    "dark_pro": ("Dark Pro", True),
+    "glassmorphism": ("Glassmorphism", True),
+    "neomorphism": ("Neomorphism", False),
+    "nexus_dark": ("Nexus Dark", True),
+    "nexus_light": ("Nexus Light", False),
+    "pyside_fusion": ("PySide Fusion", True),
+    "material_deep": ("Material Deep", True),
+    "fluent_dark": ("Fluent Dark", True),
+    "fluent_light": ("Fluent Light", False),
+    "cyber_nexus": ("Cyber Nexus", True),
+    "nord_frost": ("Nord Frost", True),
+}
+
+_INDEX_CACHE_FILE = "catalog.json"
+
+
+def _builtin_theme(name):
+    from .themes import BUILTIN_THEMES
+
+    return BUILTIN_THEMES[name]
+
+
+def _file_theme(path):
+    from .loader import load_theme_file
+
+    return load_theme_file(path, register=False)[1]
+
+
+def _read_index(path, default_name):
+    """Read the (id, display name, dark) index of a theme file"""
+    import json
+
+    from .loader import ThemeFileError
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            tokens = json.load(f)
+    except ValueError as e:
+        raise ThemeFileError(f"{path}: invalid JSON: {e}") from None
+    if not isinstance(tokens, dict):
+        raise ThemeFileError(f"{path}: a theme file must hold a JSON object")
+    name = tokens.get("id", default_name)
+    if not (isinstance(name, str) and name):
+        raise ThemeFileError(f"{path}: id must be a non-empty string, got {name!r}")
+    return name, tokens.get("name", name), _is_dark(tokens)
+
+
+def _is_dark(theme):
+    bg = theme.get("bg")
+    return is_dark_color(bg) if is_color(bg) else None
+
+
+class ThemeCatalog(MutableMapping):
+    """Mapping of theme name to tokens, loading each theme on first access"""
+
+    def __init__(self):
+        self._entries = {}  # name -> ThemeEntry, in listing order
+        self._themes = {}  # name -> loaded token dictionary
+        self._loaders = {}  # name -> callable returning the tokens
+
+    @classmethod
+    def builtin(cls):
+        """Return a catalog indexing the built-in themes"""
+        catalog = cls()
+        for name, (display_name, dark) in BUILTIN_INDEX.items():
+            catalog.register(ThemeEntry(name, display_name, dark, None),
+                             lambda name=name: _builtin_theme(name))
+        return catalog
+
+    def register(self, entry, loader):
+        """
+        Index a theme without loading it
+
+        Args:
+            entry: ThemeEntry describing the theme
+            loader: Callable returning the theme's token dictionary
+        """
+        self._entries[entry.name] = entry
+        self._themes.pop(entry.name, None)
+        self._loaders[entry.name] = loader
+
+    def add_directory(self, directory):
+        """
+        Index every *.json theme file of a directory without loading them
+
+        The index of each file (id, display name, dark/light) is cached
+        on disk by path, modification time and size, so unchanged files
+        are not even opened until their theme is requested.
+
+        Args:
+            directory: Directory holding theme files
+
+        Returns:
+            Sorted list of the indexed theme names
+
+        Raises:
+            ThemeFileError: If a file is not valid JSON, does not hold a
+                JSON object or has an invalid id
+            OSError: If a file cannot be read
+        """
+        cached = read_json(_INDEX_CACHE_FILE) or {}
+        index = {}
+        names = []
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".json"):
+                continue
+            path = os.path.abspath(os.path.join(directory, file_name))
+            stat = os.stat(path)
+            record = cached.get(path)
+            if record is None or record[:2] != [stat.st_mtime_ns, stat.st_size]:
+                record = [stat.st_mtime_ns, stat.st_size,
+                          *_read_index(path, os.path.splitext(file_name)[0])]
+            index[path] = record
+            name, display_name, dark = record[2:]
+            self.register(ThemeEntry(name, display_name, dark, path),
+                          lambda path=path: _file_theme(path))
+            names.append(name)
+        if any(cached.get(path) != record for path, record in index.items()):
+            cached.update(index)
+            write_json(_INDEX_CACHE_FILE, cached)
+        return sorted(names)
+
+    def entry(self, name):
+        """Return the ThemeEntry of a theme (KeyError if unknown)"""
+        return self._entries[name]
+
+    def entries(self):
+        """Return the ThemeEntry of every theme, in listing order"""
+        return list(self._entries.values())
+
+    def is_loaded(self, name):
+        """Return True if the tokens of a theme have been loaded"""
+        return name in self._themes
+
+    def __getitem__(self, name):
+        theme = self._themes.get(name)
+        if theme is None:
+            loader = self._loaders.get(name)
+            if loader is None:
+                raise KeyError(name)
+            theme = self._themes[name] = loader()
+            del self._loaders[name]
+        return theme
+
+    def __setitem__(self, name, theme):
+        path = self._entries[name].path if name in self._entries else None
+        self._entries[name] = ThemeEntry(
+            name, theme.get("name", name), _is_dark(theme), path)
+        self._themes[name] = theme
+        self._loaders.pop(name, None)
+
+    def __delitem__(self, name):
+        del self._entries[name]
+        self._themes.pop(name, None)
+        self._loaders.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<ThemeCatalog of {len(self)} themes, {len(self._themes)} loaded>"
@@ -0,0 +1,194 @@
+"""
+Color parsing for TkModernThemes
+
+Theme tokens may be written as #rgb, #rrggbb, #rrggbbaa, rgb(r, g, b) or
+rgba(r, g, b, a). Tk only understands opaque colors, so the theme compiler
+works on normalized #rrggbb strings. Every distinct color string is parsed
+once; the results are memoized as compact integer tuples.
+
+Translucent tokens are composited over their backdrop token when a theme
+is compiled. The backdrop is "bg" unless the theme declares a "backdrop"
+token: either the name of one token for all translucent colors, or a
+dictionary mapping token names to backdrop token names.
+"""
+
+import re
+from functools import lru_cache
+
+__all__ = ["parse_color", "to_rgb", "to_hex", "format_hex", "is_color",
+           "composite", "normalize_theme", "affected_tokens"]
+
+_FUNCTION_RE = re.compile(r"(rgba?)\(([^()]*)\)")
+
+
+def _channel(text):
+    """Parse an rgb() channel: 0-255 or a percentage"""
+    text = text.strip()
+    if text.endswith("%"):
+        value = float(text[:-1]) * 2.55
+    else:
+        value = float(text)
+    return max(0, min(255, round(value)))
+
+
+def _alpha(text):
+    """Parse an rgba() alpha: 0-1 or a percentage, scaled to 0-255"""
+    text = text.strip()
+    if text.endswith("%"):
+        value = float(text[:-1]) / 100
+    else:
+        value = float(text)
+    return max(0, min(255, round(value * 255)))
+
+
+@lru_cache(maxsize=1024)
+def _parse(value):
+    """Memoized parser behind parse_color; None if value is not a color"""
+    text = value.strip().lower()
+    if text.startswith("#"):
+        digits = text[1:]
+        if not all(c in "0123456789abcdef" for c in digits):
+            return None
+        if len(digits) in (3, 4):
+            digits = "".join(c * 2 for c in digits)
+        if len(digits) == 6:
+            digits += "ff"
+        if len(digits) != 8:
+            return None
+        return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4, 6))
+
+    match = _FUNCTION_RE.fullmatch(text.replace(" ", ""))
+    if match is None:
+        return None
+    parts = match.group(2).split(",")
+    if len(parts) != (4 if match.group(1) == "rgba" else 3):
+        return None
+    try:
+        rgb = tuple(_channel(part) for part in parts[:3])
+        alpha = _alpha(parts[3]) if len(parts) == 4 else 255
+    except ValueError:
+        return None
+    return rgb + (alpha,)
+
+
+def parse_color(value):
+    """
+    Parse a color string
+
+    Args:
+        value: #rgb, #rgba, #rrggbb, #rrggbbaa, rgb() or rgba() string
+
+    Returns:
+        (r, g, b, a) tuple of integers in 0-255
+
+    Raises:
+        ValueError: If value is not a color in one of these formats
+    """
+    parsed = _parse(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise ValueError(f"Invalid color: {value!r}")
+    return parsed
+
+
+def is_color(value):
+    """Return True if value is a color string parse_color accepts"""
+    return isinstance(value, str) and _parse(value) is not None
+
+
+def to_rgb(value):
+    """Return the (r, g, b) triple of a color string, ignoring alpha"""
+    return parse_color(value)[:3]
+
+
+def format_hex(rgb):
+    """Format an (r, g, b) triple as #rrggbb"""
+    r, g, b = rgb[:3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+@lru_cache(maxsize=1024)
+def to_hex(value):
+    """
+    Normalize a color string to the opaque #rrggbb form Tk understands
+
+    Args:
+        value: Color string in any format parse_color accepts
+
+    Returns:
+        Lowercase #rrggbb string (any alpha channel is dropped)
+    """
+    return format_hex(parse_color(value))
+
+
+@lru_cache(maxsize=1024)
+def composite(color, backdrop):
+    """
+    Blend a translucent color over an opaque backdrop
+
+    Args:
+        color: Color string, possibly with an alpha channel
+        backdrop: Color string it is drawn on (its alpha is ignored)
+
+    Returns:
+        Opaque #rrggbb string
+    """
+    *rgb, alpha = parse_color(color)
+    base = to_rgb(backdrop)
+    return format_hex(tuple(round((c * alpha + b * (255 - alpha)) / 255)
+                            for c, b in zip(rgb, base)))
+
+
+def _backdrop_name(theme, key):
+    """Name of the token a translucent token is composited over"""
+    backdrop = theme.get("backdrop", "bg")
+    if isinstance(backdrop, dict):
+        return backdrop.get(key, "bg")
+    return backdrop
+
+
+def _translucent_tokens(theme):
+    """Yield (token, backdrop token) for every translucent color token"""
+    for key, value in theme.items():
+        if is_color(value) and parse_color(value)[3] != 255:
+            name = _backdrop_name(theme, key)
+            if name != key and is_color(theme.get(name)):
+                yield key, name
+
+
+def normalize_theme(theme):
+    """
+    Return a copy of a theme with every color token as opaque #rrggbb
+
+    Translucent tokens are composited over their backdrop token. Tokens
+    that are not color strings (names, fonts, numbers, shadow
+    descriptions) are copied unchanged. The source theme is not modified.
+
+    Args:
+        theme: Theme dictionary
+
+    Returns:
+        New theme dictionary
+    """
+    normalized = {key: to_hex(value) if is_color(value) else value
+                  for key, value in theme.items()}
+    for key, name in _translucent_tokens(theme):
+        normalized[key] = composite(theme[key], theme[name])
+    return normalized
+
+
+def affected_tokens(theme, tokens):
+    """
+    Extend changed tokens with the translucent tokens composited over them
+
+    Args:
+        theme: Theme dictionary
+        tokens: Names of the changed tokens
+
+    Returns:
+        Set of token names whose normalized value may have changed
+    """
+    tokens = set(tokens)
+    for key, name in _translucent_tokens(theme):
+        if name in tokens or "backdrop" in tokens:
+            tokens.add(key)
+    return tokens
@@ -0,0 +1,248 @@
+"""
+Demo application for TkModernThemes
+
+Run with: python -m TkModernThemes
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from .engine import ThemedTk
+
+
+def create_demo(root=None):
+    """
+    Launch an advanced demo application showcasing all themes
+
+    Args:
+        root: Optional Tkinter root window. If None, a new window will be created.
+
+    Returns:
+        The root window containing the demo
+    """
+    # Create window if not provided
+    create_window = root is None
+    if create_window:
+        root = tk.Tk()
+        root.title("TkModernThemes Demo")
+        root.geometry("1000x700")
+
+        # Center the window
+        window_width = 1000
+        window_height = 700
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        x = (screen_width // 2) - (window_width // 2)
+        y = (screen_height // 2) - (window_height // 2)
+        root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+
+    # Apply theme to root window
+    theme = ThemedTk(root)
+    theme.set_theme("nexus_dark")
+
+    # Main container with scrollable content
+    main_container = ttk.Frame(root)
+    main_container.pack(fill=tk.BOTH, expand=True)
+
+    # Create a canvas and scrollbar for the main content
+    canvas = tk.Canvas(main_container)
+    scrollbar = ttk.Scrollbar(
+        main_container, orient="vertical", command=canvas.yview)
+    scrollable_frame = ttk.Frame(canvas)
+
+    # Configure the canvas scrolling
+    scrollable_frame.bind(
+        "<Configure>",
+        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+    )
+
+    # Create a window in the canvas to contain the scrollable frame
+    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+
+    # Pack the canvas and scrollbar
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+
+    # Bind mousewheel for scrolling
+    def _on_mousewheel(event):
+        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+    # Create demo components
+    def create_demo_components():
+        # Create a card for theme selection
+        theme_card = theme.create_card(scrollable_frame, padding=20)
+        theme_card.pack(fill=tk.X, padx=20, pady=20)
+
+        # Theme selection header
+        ttk.Label(theme_card, text="Select Theme", style="Heading.TLabel",
+                  font=("", 14, "bold")).pack(anchor=tk.W, pady=(0, 15))
+
+        # Theme selection frame
+        theme_frame = ttk.Frame(theme_card)
+        theme_frame.pack(fill=tk.X)
+
+        # Create radio buttons for theme selection
+        theme_var = tk.StringVar(value=theme.get_current_theme())
+
+        # Create a frame for the theme buttons with a grid layout
+        theme_grid = ttk.Frame(theme_frame)
+        theme_grid.pack(fill=tk.X, pady=10)
+
+        # Add theme selection buttons in a grid
+        for i, theme_name in enumerate(theme.get_theme_list()):
+            btn = ttk.Radiobutton(
+                theme_grid,
+                text=theme_name.replace('_', ' ').title(),
+                variable=theme_var,
+                value=theme_name,
+                command=lambda n=theme_name: theme.set_theme(n)
+            )
+            btn.grid(row=i//3, column=i % 3, padx=10, pady=5, sticky=tk.W)
+
+        # Add some sample widgets in a card
+        widget_card = theme.create_card(scrollable_frame, padding=20)
+        widget_card.pack(fill=tk.X, padx=20, pady=(0, 20))
+
+        # Widget demo header
+        ttk.Label(widget_card, text="Widget Showcase", style="Heading.TLabel",
+                  font=("", 14, "bold")).pack(anchor=tk.W, pady=(0, 15))
+
+        # Create a frame for the widget grid
+        widget_frame = ttk.Frame(widget_card)
+        widget_frame.pack(fill=tk.X)
+
+        # Add some basic widgets
+        # Entry field
+        ttk.Label(widget_frame, text="Text Entry:").grid(
+            row=0, column=0, sticky=tk.W, pady=5)
+        entry = ttk.Entry(widget_frame)
+        entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+
+        # Buttons
+        ttk.Button(widget_frame, text="Primary Button").grid(
+            row=1, column=0, padx=5, pady=5)
+        ttk.Button(widget_frame, text="Secondary Button", style="Secondary.TButton").grid(
+            row=1, column=1, padx=5, pady=5)
+
+        # Checkbuttons
+        check_var1 = tk.BooleanVar()
+        check_var2 = tk.BooleanVar(value=True)
+        ttk.Checkbutton(widget_frame, text="Check me", variable=check_var1).grid(
+            row=2, column=0, sticky=tk.W, pady=5)
+        ttk.Checkbutton(widget_frame, text="Checked by default", variable=check_var2).grid(
+            row=2, column=1, sticky=tk.W, pady=5)
+
+        # Radio buttons
+        radio_var = tk.StringVar(value="option1")
+        ttk.Label(widget_frame, text="Options:").grid(
+            row=3, column=0, sticky=tk.W, pady=5)
+        ttk.Radiobutton(widget_frame, text="Option 1", variable=radio_var,
+                        value="option1").grid(row=4, column=0, sticky=tk.W)
+        ttk.Radiobutton(widget_frame, text="Option 2", variable=radio_var,
+                        value="option2").grid(row=5, column=0, sticky=tk.W)
+
+        # Scale
+        ttk.Label(widget_frame, text="Volume:").grid(
+            row=3, column=1, sticky=tk.W, pady=5)
+        scale = ttk.Scale(widget_frame, from_=0, to=100, orient=tk.HORIZONTAL)
+        scale.set(50)
+        scale.grid(row=4, column=1, sticky=tk.EW, padx=5)
+
+        # Progress bar
+        ttk.Label(widget_frame, text="Progress:").grid(
+            row=5, column=1, sticky=tk.W, pady=5)
+        progress = ttk.Progressbar(widget_frame, mode='determinate', value=65)
+        progress.grid(row=6, column=1, sticky=tk.EW, padx=5, pady=5)
+
+        # Configure grid weights
+        widget_frame.columnconfigure(1, weight=1)
+
+        # Add a separator
+        ttk.Separator(scrollable_frame, orient=tk.HORIZONTAL).pack(
+            fill=tk.X, padx=20, pady=10)
+
+        # Add a sample table (Treeview)
+        table_card = theme.create_card(scrollable_frame, padding=20)
+        table_card.pack(fill=tk.X, padx=20, pady=(0, 20))
+
+        ttk.Label(table_card, text="Data Table", style="Heading.TLabel",
+                  font=("", 14, "bold")).pack(anchor=tk.W, pady=(0, 15))
+
+        # Create a frame for the treeview and scrollbar
+        tree_frame = ttk.Frame(table_card)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Add a scrollbar to the treeview
+        tree_scroll = ttk.Scrollbar(tree_frame)
+        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Create the treeview
+        tree = ttk.Treeview(
+            tree_frame,
+            columns=("Name", "Status", "Progress"),
+            show="headings",
+            yscrollcommand=tree_scroll.set,
+            height=5
+        )
+
+        # Configure the scrollbar
+        tree_scroll.config(command=tree.yview)
+
+        # Define columns
+        tree.heading("Name", text="Name")
+        tree.heading("Status", text="Status")
+        tree.heading("Progress", text="Progress")
+
+        # Set column widths
+        tree.column("Name", width=200)
+        tree.column("Status", width=150)
+        tree.column("Progress", width=100)
+
+        # Add sample data
+        sample_data = [
+            ("Project Alpha", "Active", "85%"),
+            ("Project Beta", "Pending", "45%"),
+            ("Project Gamma", "Complete", "100%"),
+            ("Project Delta", "Active", "62%"),
+        ]
+
+        for item in sample_data:
+            tree.insert("", tk.END, values=item)
+
+        # Pack the treeview
+        tree.pack(fill=tk.BOTH, expand=True)
+
+        # Add a tabbed interface example
+        tab_card = theme.create_card(scrollable_frame, padding=20)
+        tab_card.pack(fill=tk.X, padx=20, pady=(0, 20))
+
+        ttk.Label(tab_card, text="Tabbed Interface", style="Heading.TLabel",
+                  font=("", 14, "bold")).pack(anchor=tk.W, pady=(0, 15))
+
+        # Create a notebook (tabbed interface)
+        notebook = ttk.Notebook(tab_card)
+        notebook.pack(fill=tk.BOTH, expand=True)
+
+        # Create and add tabs
+        for i in range(3):
+            tab = ttk.Frame(notebook, padding=10)
+            notebook.add(tab, text=f"Tab {i+1}")
+            ttk.Label(
+                tab, text=f"This is the content of Tab {i+1}").pack(pady=20)
+
+    # Create all demo components
+    create_demo_components()
+
+    # Start the main loop if we created the window
+    if create_window:
+        root.mainloop()
+
+    return root
+
+
+# Allow running as standalone demo
+if __name__ == "__main__":
+    create_demo(None)
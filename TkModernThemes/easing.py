@@ -0,0 +1,107 @@
+"""
+Easing curves for TkModernThemes animations
+
+An easing maps the elapsed fraction of an animation (0 to 1) to its
+progress (0 at the start value, 1 at the end value; the back and spring
+curves overshoot). easing_table() samples a curve once per (easing, step
+count) and memoizes the result, so running animations read the progress
+of each step from a table instead of evaluating the curve every frame.
+
+Usage:
+    animate_widget(button, "width", 10, 20, easing="ease_out_back")
+"""
+
+import math
+from functools import lru_cache
+
+__all__ = ["EASINGS", "easing_table"]
+
+# Overshoot of the back curves (about 10%)
+_BACK = 1.70158
+_BACK_IN_OUT = _BACK * 1.525
+
+
+def _linear(t):
+    return t
+
+
+def _ease_in_cubic(t):
+    return t ** 3
+
+
+def _ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def _ease_in_out_cubic(t):
+    return 4 * t ** 3 if t < 0.5 else 1 - (2 - 2 * t) ** 3 / 2
+
+
+def _ease_in_quint(t):
+    return t ** 5
+
+
+def _ease_out_quint(t):
+    return 1 - (1 - t) ** 5
+
+
+def _ease_in_out_quint(t):
+    return 16 * t ** 5 if t < 0.5 else 1 - (2 - 2 * t) ** 5 / 2
+
+
+def _ease_in_back(t):
+    return (_BACK + 1) * t ** 3 - _BACK * t ** 2
+
+
+def _ease_out_back(t):
+    return 1 + (_BACK + 1) * (t - 1) ** 3 + _BACK * (t - 1) ** 2
+
+
+def _ease_in_out_back(t):
+    if t < 0.5:
+        return (2 * t) ** 2 * ((_BACK_IN_OUT + 1) * 2 * t - _BACK_IN_OUT) / 2
+    return ((2 * t - 2) ** 2 * ((_BACK_IN_OUT + 1) * (2 * t - 2) + _BACK_IN_OUT) + 2) / 2
+
+
+def _spring(t):
+    # Damped oscillation settling on 1; cos(4.5 pi) = 0 makes t = 1 exact
+    return 1 - math.cos(4.5 * math.pi * t) * math.exp(-6 * t)
+
+
+# Easing name -> curve
+EASINGS = {
+    "linear": _linear,
+    "ease_in_cubic": _ease_in_cubic,
+    "ease_out_cubic": _ease_out_cubic,
+    "ease_in_out_cubic": _ease_in_out_cubic,
+    "ease_in_quint": _ease_in_quint,
+    "ease_out_quint": _ease_out_quint,
+    "ease_in_out_quint": _ease_in_out_quint,
+    "ease_in_back": _ease_in_back,
+    "ease_out_back": _ease_out_back,
+    "ease_in_out_back": _ease_in_out_back,
+    "spring": _spring,
+}
+
+
+@lru_cache(maxsize=128)
+def easing_table(easing, steps):
+    """
+    Sample an easing curve at every step of an animation
+
+    Args:
+        easing: Name of a curve in EASINGS, or a callable mapping 0-1 to
+            the progress
+        steps: Number of steps; the table holds steps + 1 values
+
+    Returns:
+        Tuple of progress values, 0 at the first step and 1 at the last
+
+    Raises:
+        ValueError: If easing is an unknown name
+    """
+    curve = easing if callable(easing) else EASINGS.get(easing)
+    if curve is None:
+        raise ValueError(f"Unknown easing: {easing!r}. "
+                         f"Available easings: {', '.join(EASINGS)}")
+    return tuple(curve(step / steps) for step in range(steps)) + (1.0,)
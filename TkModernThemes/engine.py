@@ -0,0 +1,679 @@
+"""
+ttk theme engine for TkModernThemes
+
+Compiles THEMES entries into one ttk theme each and applies them through
+ThemedTk. The package imports this module on first use of ThemedTk or
+the widget helpers, so code that only reads THEMES does not load ttk.
+"""
+
+import hashlib
+import weakref
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from tkinter import ttk
+
+from . import THEMES
+from .colors import affected_tokens, is_color, normalize_theme, to_hex
+from .fonts import NamedFonts
+from .loader import precompiled_script
+from .profiling import ProfileReport, profiled
+from .styles import STYLE_ROWS, dependent_rows, resolve_style_table
+
+__all__ = ["ThemedTk", "CacheInfo", "ApplyStats", "create_card", "create_sidebar"]
+
+
+# Prefix of the ttk themes that ThemedTk creates for each THEMES entry
+_TTK_THEME_PREFIX = "tkmt_"
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+ApplyStats = namedtuple("ApplyStats", ["applied", "skipped"])
+
+# Style table value of a row to reset to what the parent style provides
+# (ttk has no way to unset a style option)
+_INHERIT = object()
+
+
+def _settings_from_table(table):
+    """Rebuild a theme settings dictionary from (part of) a style table"""
+    settings = {}
+    for (style, kind, option), value in table.items():
+        spec = settings.setdefault(style, {})
+        if kind == "layout":
+            spec["layout"] = value
+        else:
+            spec.setdefault(kind, {})[option] = value
+    return settings
+
+
+def _removed_rows(old_table, new_table):
+    """Reset the rows of old_table that new_table no longer sets"""
+    return {key: _INHERIT for key in old_table if key not in new_table}
+
+
+def _parent_style(style):
+    """Name of the style ttk falls back on for options style does not set"""
+    return style.split(".", 1)[1] if "." in style[1:] else "."
+
+
+class _CompiledTheme:
+    """Resolved style table of a theme and the Tcl script applying it"""
+
+    def __init__(self, ttk_name, token_hash, table=None, script=None,
+                 theme=None, size=None):
+        """
+        Args:
+            ttk_name: Name of the ttk theme the script fills
+            token_hash: Content hash of the theme tokens
+            table: Resolved style table, or None to resolve it from theme
+                when first needed
+            script: Precompiled script (e.g. from a theme file cache)
+            theme: Theme dictionary, needed when table is None
+            size: Number of rows of the table, needed when table is None
+        """
+        self.ttk_name = ttk_name
+        self.token_hash = token_hash
+        self._table = table
+        self._script = script
+        self._theme = theme
+        self.size = len(table) if table is not None else size
+
+    @property
+    def table(self):
+        """Resolved style table: (style, kind, option) -> value"""
+        if self._table is None:
+            self._table = resolve_style_table(normalize_theme(self._theme))
+        return self._table
+
+    @property
+    def script(self):
+        """Tcl script filling the ttk theme with the whole table"""
+        if self._script is None:
+            self._script = _compile_settings(
+                self.ttk_name, _settings_from_table(self.table))
+        return self._script
+
+
+class _ThemeCache:
+    """LRU cache of compiled themes keyed by (theme name, token hash)"""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Return the cached entry for key, or None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Store an entry, evicting the least recently used ones"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, theme_name):
+        """Drop every entry compiled for theme_name"""
+        for key in [key for key in self._entries if key[0] == theme_name]:
+            del self._entries[key]
+
+    def clear(self):
+        """Drop every entry and reset the statistics"""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        """Return hit/miss statistics"""
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._entries))
+
+
+# Compiled themes are interpreter independent, so all managers share them
+_theme_cache = _ThemeCache()
+
+
+def _token_hash(theme):
+    """Content hash of a theme's token dictionary"""
+    return hashlib.sha1(repr(sorted(theme.items())).encode("utf-8")).hexdigest()
+
+
+def _tcl_word(value):
+    """Quote a Python value as a single Tcl word"""
+    if isinstance(value, (list, tuple)):
+        value = " ".join(_tcl_word(item) for item in value)
+    value = str(value)
+    if value and not any(c in value for c in ' \t\n{}[]$";\\'):
+        return value
+    depth = 0
+    for c in value:
+        depth += {"{": 1, "}": -1}.get(c, 0)
+        if depth < 0:
+            break
+    # Braces keep backslash-newline and escaped braces special, so values
+    # holding a backslash are escaped character by character instead
+    if depth == 0 and "\\" not in value:
+        return "{" + value + "}"
+    return "".join("\\" + c if c in ' \t{}[]$";\\' else c
+                   for c in value).replace("\n", "\\n")
+
+
+def _tcl_layout(layoutspec):
+    """Format a ttk layout list as Tcl"""
+    words = []
+    for element, options in layoutspec:
+        words.append(_tcl_word(element))
+        for key, value in (options or {}).items():
+            if key == "children":
+                value = _tcl_layout(value)
+            words.append(f"-{key} {_tcl_word(value)}")
+    return " ".join(words)
+
+
+def _tcl_statespec(items):
+    """Format the (state..., value) tuples of a style map option as Tcl"""
+    words = []
+    for *state, value in items:
+        words.append(_tcl_word(" ".join(state)))
+        words.append(_tcl_word(value))
+    return " ".join(words)
+
+
+def _compile_settings(ttk_name, settings, create=True):
+    """
+    Compile theme settings into one ttk::style Tcl script
+
+    The script creates the ttk theme (parented on clam) if it does not
+    exist yet and then applies every configure, map and layout setting
+    inside a single ``ttk::style theme settings`` block. Values set to
+    _INHERIT copy the parent style's configure value or layout, or clear
+    the style map option.
+
+    Args:
+        ttk_name: Name of the ttk theme to fill
+        settings: Settings dictionary as produced by _settings_from_table
+        create: Whether the script creates the ttk theme if needed
+
+    Returns:
+        Tcl script string
+    """
+    lines = []
+    for style, spec in settings.items():
+        parent = _tcl_word(_parent_style(style))
+        style = _tcl_word(style)
+        if spec.get("layout") is _INHERIT:
+            lines.append(f"ttk::style layout {style} [ttk::style layout {parent}]")
+        elif "layout" in spec:
+            lines.append(f"ttk::style layout {style} "
+                         f"{_tcl_word(_tcl_layout(spec['layout']))}")
+        if spec.get("configure"):
+            options = " ".join(
+                f"-{key} [ttk::style lookup {parent} -{key}]" if value is _INHERIT
+                else f"-{key} {_tcl_word(value)}"
+                for key, value in spec["configure"].items())
+            lines.append(f"ttk::style configure {style} {options}")
+        if spec.get("map"):
+            options = " ".join(
+                f"-{key} {{}}" if value is _INHERIT
+                else f"-{key} {_tcl_word(_tcl_statespec(value))}"
+                for key, value in spec["map"].items())
+            lines.append(f"ttk::style map {style} {options}")
+    name = _tcl_word(ttk_name)
+    script = (f"ttk::style theme settings {name} {{\n    "
+              + "\n    ".join(lines) + "\n}")
+    if not create:
+        return script
+    return (f"if {{[lsearch -exact [ttk::style theme names] {name}] < 0}} "
+            f"{{ttk::style theme create {name} -parent clam}}\n" + script)
+
+
+class _ThemeEngine:
+    """ttk state shared by every ThemedTk on one Tcl interpreter"""
+
+    def __init__(self, tk_root):
+        # Only the interpreter is kept: a reference to tk_root would keep
+        # the _engines entry alive after the window is destroyed
+        self.tk = tk_root.tk
+        self.compiled_themes = {}  # ttk theme name -> _CompiledTheme applied to it
+        self.fonts = NamedFonts(tk_root)  # referenced by name from every style
+
+
+# ttk styles are global to an interpreter, so are the engines; keyed by the
+# Tk instance that owns the interpreter
+_engines = weakref.WeakKeyDictionary()
+
+
+def _engine_for(widget):
+    """Return the theme engine of the interpreter widget belongs to"""
+    tk_root = widget._root()
+    engine = _engines.get(tk_root)
+    if engine is None or engine.tk is not tk_root.tk:
+        engine = _engines[tk_root] = _ThemeEngine(tk_root)
+    return engine
+
+
+class ThemedTk:
+    """Advanced theme manager with PySide6 and Nexus UI inspired styling"""
+
+    def __init__(self, root):
+        """
+        Initialize the theme manager
+
+        Args:
+            root: Tkinter root window or Toplevel widget
+        """
+        self.root = root
+        self.current_theme = None
+        self._engine = _engine_for(root)
+        self.style = ttk.Style(root)
+        self.fonts = self._engine.fonts.fonts  # role -> tkinter.font.Font
+        self._theme_data = None
+        self._theme_cache = _theme_cache  # Compiled themes, shared by managers
+        # ttk theme name -> _CompiledTheme applied to it, shared by every
+        # manager on the same interpreter
+        self._compiled_themes = self._engine.compiled_themes
+        self._root_theme = None  # (theme name, token hash) shown by root
+        self.last_apply_stats = None  # ApplyStats of the last set_theme
+        self.reapplies_avoided = 0  # update_theme_colors calls merged by batch()
+        self._batch_depth = 0
+        self._deferred_updates = 0
+        self._pending_tokens = {}  # theme name -> tokens edited in a batch (None: unknown)
+        self.profile_report = None  # ProfileReport while profiling is enabled
+
+    def set_theme(self, theme_name):
+        """
+        Apply a theme to the Tkinter window
+
+        Args:
+            theme_name: Name of the theme to apply
+
+        Raises:
+            ValueError: If theme name is not found
+        """
+        if theme_name not in THEMES:
+            available = ", ".join(THEMES.keys())
+            raise ValueError(
+                f"Theme '{theme_name}' not found. Available themes: {available}")
+        with self._profiled():
+            self._apply_theme(theme_name)
+
+    def _apply_theme(self, theme_name, changed_tokens=None):
+        """
+        Apply a theme known to exist in THEMES
+
+        Args:
+            theme_name: Name of the theme to apply
+            changed_tokens: Names of the tokens edited since the theme was
+                last applied, or None if unknown
+        """
+        theme = THEMES[theme_name]
+        self.current_theme = theme_name
+        self._theme_data = theme
+
+        root_theme = (theme_name, _token_hash(theme))
+        if self._root_theme != root_theme:
+            # Configure root window with theme background, normalized like
+            # the style colors (Tk color names pass through)
+            bg = theme["bg"]
+            if is_color(bg):
+                bg = to_hex(bg)
+            self.root.configure(bg=bg)
+
+            # Apply blur effect if supported and enabled
+            if theme.get("blur", False) and hasattr(self.root, 'attributes'):
+                try:
+                    # Windows-specific blur effect
+                    self.root.attributes('-transparentcolor', bg)
+                    self.root.attributes('-alpha', 0.98)
+                except:
+                    pass  # Blur not supported on this platform
+            self._root_theme = root_theme
+
+        # Styles reference the named fonts, so a font change is a font
+        # configure that Tk propagates to every widget
+        self._engine.fonts.apply(theme)
+
+        # Each theme lives in its own ttk theme (parented on clam), built on
+        # first use. Later switches are a single theme_use call, skipped
+        # when the interpreter already shows the unchanged theme (theme_use
+        # sends <<ThemeChanged>> to every widget)
+        ttk_name = self._compile_theme(theme_name, theme, changed_tokens)
+        if self.last_apply_stats.applied or self.style.theme_use() != ttk_name:
+            self.style.theme_use(ttk_name)
+
+    def _compile_theme(self, theme_name, theme, changed_tokens=None):
+        """
+        Create the ttk theme for a THEMES entry if it is not built yet
+
+        Args:
+            theme_name: Name of the theme in THEMES
+            theme: Theme dictionary
+            changed_tokens: Names of the tokens edited since the ttk theme
+                was filled, used to limit the diff to their dependents
+
+        Returns:
+            Name of the ttk theme holding the compiled styles
+        """
+        ttk_name = _TTK_THEME_PREFIX + theme_name
+        token_hash = _token_hash(theme)
+        if changed_tokens is not None:
+            # Translucent tokens follow the backdrop they are composited over
+            changed_tokens = affected_tokens(theme, changed_tokens)
+        applied = self._compiled_themes.get(ttk_name)
+        if applied is not None and applied.token_hash == token_hash:
+            self.last_apply_stats = ApplyStats(0, applied.size)
+            return ttk_name
+
+        # Rebuild when the tokens changed since the ttk theme was filled,
+        # which also picks up direct edits to THEMES
+        compiled = self._get_compiled(theme_name, theme, token_hash,
+                                      applied, changed_tokens)
+        if applied is None:
+            changed = None  # the whole table
+            script = compiled.script
+            count = compiled.size
+        else:
+            candidates = compiled.table.keys()
+            if changed_tokens is not None:
+                candidates = dependent_rows(changed_tokens)
+            # Only rewrite the (style, option) values that differ from what
+            # the ttk theme already holds
+            changed = {key: compiled.table[key] for key in candidates
+                       if key in compiled.table
+                       and applied.table.get(key) != compiled.table[key]}
+            # Rows that no longer resolve must not keep their old value
+            changed.update(_removed_rows(applied.table, compiled.table))
+            script = _compile_settings(ttk_name, _settings_from_table(changed))
+            count = len(changed)
+        if count and self.profile_report is not None:
+            # Profiling evaluates one script per style so time can be
+            # attributed to style names
+            if changed is None:
+                changed = compiled.table
+            self.style.tk.eval(_compile_settings(ttk_name, {}))
+            for style, spec in _settings_from_table(changed).items():
+                with self.profile_report.attribute(style):
+                    self.style.tk.eval(
+                        _compile_settings(ttk_name, {style: spec}, create=False))
+        elif count:
+            # One round-trip for the whole theme instead of one per style call
+            self.style.tk.eval(script)
+        self._compiled_themes[ttk_name] = compiled
+        self.last_apply_stats = ApplyStats(count, compiled.size - count)
+        return ttk_name
+
+    def _get_compiled(self, theme_name, theme, token_hash, base=None,
+                      changed_tokens=None):
+        """
+        Return the compiled theme from the cache, resolving it on a miss
+
+        Args:
+            theme_name: Name of the theme in THEMES
+            theme: Theme dictionary
+            token_hash: Content hash of the theme dictionary
+            base: Previously compiled version of the theme, if any
+            changed_tokens: Tokens edited since base was compiled; only the
+                rows reading them are resolved again
+
+        Returns:
+            _CompiledTheme for the theme's current tokens
+        """
+        key = (theme_name, token_hash)
+        compiled = self._theme_cache.get(key)
+        precompiled = None
+        if compiled is None and (base is None or changed_tokens is None):
+            precompiled = precompiled_script(theme_name, token_hash)
+        if precompiled is not None:
+            # Loaded from a theme file; the table is only resolved if a
+            # later update needs to diff against it
+            script, size = precompiled
+            compiled = _CompiledTheme(_TTK_THEME_PREFIX + theme_name, token_hash,
+                                      script=script, theme=dict(theme), size=size)
+            self._theme_cache.put(key, compiled)
+        elif compiled is None:
+            # Styles are resolved from #rrggbb colors; THEMES keeps the
+            # tokens as written
+            colors = normalize_theme(theme)
+            if base is None or changed_tokens is None:
+                table = resolve_style_table(colors)
+            else:
+                rows = dependent_rows(changed_tokens)
+                updates = resolve_style_table(colors, rows)
+                table = {}
+                for row in STYLE_ROWS:
+                    if row in rows:
+                        if row in updates:
+                            table[row] = updates[row]
+                    elif row in base.table:
+                        table[row] = base.table[row]
+            compiled = _CompiledTheme(
+                _TTK_THEME_PREFIX + theme_name, token_hash, table)
+            self._theme_cache.put(key, compiled)
+        return compiled
+
+    def cache_info(self):
+        """
+        Get statistics of the compiled theme cache
+
+        Returns:
+            CacheInfo named tuple with hits, misses, maxsize and currsize
+        """
+        return self._theme_cache.info()
+
+    def get_theme_list(self):
+        """Return list of available theme names"""
+        return list(THEMES.keys())
+
+    def get_current_theme(self):
+        """Return current theme name"""
+        return self.current_theme
+
+    def get_theme_colors(self, theme_name=None):
+        """
+        Get color dictionary for a theme
+
+        Args:
+            theme_name: Name of theme (uses current theme if None)
+
+        Returns:
+            Dictionary of theme colors
+        """
+        if theme_name is None:
+            return self._theme_data
+        return THEMES.get(theme_name)
+
+    def update_theme_colors(self, **kwargs):
+        """
+        Update specific colors in the current theme
+
+        Args:
+            **kwargs: Color properties to update (bg, fg, accent, etc.)
+        """
+        if self.current_theme is None:
+            raise ValueError("No theme is currently set")
+
+        current_theme_name = self.current_theme
+        theme = THEMES[current_theme_name]
+
+        # The changed tokens alone describe the edit only if the ttk theme
+        # matched THEMES beforehand (THEMES may also be edited directly)
+        applied = self._compiled_themes.get(_TTK_THEME_PREFIX + current_theme_name)
+        in_sync = applied is not None and applied.token_hash == _token_hash(theme)
+
+        # Update the theme in the global THEMES dictionary
+        changed_tokens = set()
+        for key, value in kwargs.items():
+            if key in theme and theme[key] != value:
+                theme[key] = value
+                changed_tokens.add(key)
+
+        # Drop the stale compiled styles; the ttk theme is rebuilt because
+        # the token hash changed, touching only the rows that read the
+        # changed tokens
+        self._theme_cache.invalidate(current_theme_name)
+        if self._batch_depth:
+            if current_theme_name not in self._pending_tokens:
+                self._pending_tokens[current_theme_name] = set() if in_sync else None
+            pending = self._pending_tokens[current_theme_name]
+            if pending is not None:
+                pending.update(changed_tokens)
+            self._deferred_updates += 1
+            return
+        with self._profiled():
+            self._apply_theme(current_theme_name,
+                              changed_tokens if in_sync else None)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer the re-applies of update_theme_colors until the block exits
+
+        Token changes are written to THEMES right away, but the theme is
+        reapplied once when the outermost batch exits.
+
+        Example:
+            with theme.batch():
+                theme.update_theme_colors(bg="#101010")
+                theme.update_theme_colors(fg="#f0f0f0", accent="#ff5500")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+
+    def _flush_batch(self):
+        """Reapply the current theme once for all deferred token changes"""
+        deferred, self._deferred_updates = self._deferred_updates, 0
+        pending, self._pending_tokens = self._pending_tokens, {}
+        if not deferred or self.current_theme is None:
+            return
+        # Tokens of other themes edited in the block are picked up through
+        # their token hash the next time those themes are applied
+        with self._profiled():
+            self._apply_theme(self.current_theme, pending.get(self.current_theme))
+        self.reapplies_avoided += deferred - 1
+
+    def enable_profiling(self, max_slowest=10):
+        """
+        Start recording the Tcl calls made by this theme manager
+
+        set_theme, update_theme_colors and the create_* helpers are
+        instrumented, including the named font updates; each compiled theme
+        script is split per style so its time shows up under the style names.
+
+        Args:
+            max_slowest: Number of slowest calls to keep
+
+        Returns:
+            ProfileReport that collects the results
+        """
+        self.profile_report = ProfileReport(max_slowest)
+        return self.profile_report
+
+    def disable_profiling(self):
+        """
+        Stop recording Tcl calls
+
+        Returns:
+            The ProfileReport collected since enable_profiling, or None
+        """
+        report, self.profile_report = self.profile_report, None
+        return report
+
+    @contextmanager
+    def _profiled(self, *widgets, style=None):
+        """Instrument root, style and widgets for the block when profiling"""
+        if self.profile_report is None:
+            yield lambda widget: widget
+            return
+        fonts = self._engine.fonts
+        with profiled(self.profile_report, self.root, self.style, fonts,
+                      fonts.resolver, *widgets) as release, \
+                self.profile_report.attribute(style):
+            yield release
+
+    def create_card(self, parent, **kwargs):
+        """
+        Create a styled card frame
+
+        Args:
+            parent: Parent widget
+            **kwargs: Additional arguments passed to ttk.Frame
+
+        Returns:
+            ttk.Frame with Card style
+        """
+        with self._profiled(parent, style="Card.TFrame") as release:
+            card = release(ttk.Frame(parent, style="Card.TFrame", **kwargs))
+        return card
+
+    def create_sidebar(self, parent, width=250, **kwargs):
+        """
+        Create a styled sidebar frame
+
+        Args:
+            parent: Parent widget
+            width: Width of sidebar
+            **kwargs: Additional arguments
+
+        Returns:
+            ttk.Frame with Sidebar style
+        """
+        with self._profiled(parent, style="Sidebar.TFrame") as release:
+            sidebar = release(ttk.Frame(parent, style="Sidebar.TFrame",
+                                        width=width, **kwargs))
+        return sidebar
+
+    def create_toolbar(self, parent, **kwargs):
+        """
+        Create a styled toolbar frame
+
+        Args:
+            parent: Parent widget
+            **kwargs: Additional arguments
+
+        Returns:
+            ttk.Frame with Toolbar style
+        """
+        with self._profiled(parent, style="Toolbar.TFrame") as release:
+            toolbar = release(ttk.Frame(parent, style="Toolbar.TFrame", **kwargs))
+        return toolbar
+
+
+def create_card(parent, **kwargs):
+    """
+    Utility function to create a styled card frame
+
+    Args:
+        parent: Parent widget
+        **kwargs: Additional arguments passed to ttk.Frame
+
+    Returns:
+        ttk.Frame with Card style
+    """
+    return ttk.Frame(parent, style="Card.TFrame", **kwargs)
+
+
+def create_sidebar(parent, width=250, **kwargs):
+    """
+    Utility function to create a styled sidebar
+
+    Args:
+        parent: Parent widget
+        width: Sidebar width
+        **kwargs: Additional arguments
+
+    Returns:
+        ttk.Frame with Sidebar style
+    """
+    return ttk.Frame(parent, style="Sidebar.TFrame", width=width, **kwargs)
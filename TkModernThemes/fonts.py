@@ -0,0 +1,255 @@
+"""
+Named fonts for TkModernThemes
+
+Styles never embed font tuples. They reference a small set of named Tk
+fonts (body, heading, mono, small) that every interpreter creates once.
+Switching themes reconfigures only those fonts, and Tk redraws every
+widget using them without re-styling anything.
+
+Theme families that are not installed (Segoe UI on Linux, say) are
+resolved once per process through FALLBACK_CHAINS and GENERIC_FALLBACKS
+(GENERIC_MONO_FALLBACKS for the mono font, which stays fixed-width)
+instead of letting Tk fall back on every lookup. The resolutions are
+also stored in the on-disk cache, keyed by the state of the system font
+configuration, so a cold start does not need to enumerate font families.
+"""
+
+import glob
+import os
+import sys
+import tkinter.font as tkfont
+
+from .cache import read_json, write_json
+
+__all__ = ["FONT_NAMES", "FALLBACK_CHAINS", "GENERIC_FALLBACKS",
+           "GENERIC_MONO_FALLBACKS",
+           "font_options", "FontResolver", "NamedFonts"]
+
+# Font role -> Tk font name referenced by the style table
+FONT_NAMES = {
+    "body": "TkmtBody",
+    "heading": "TkmtHeading",
+    "mono": "TkmtMono",
+    "small": "TkmtSmall",
+}
+
+# Tk knows only normal and bold; map CSS-like weights onto them
+_WEIGHTS = {
+    "thin": "normal", "light": "normal", "normal": "normal",
+    "regular": "normal", "medium": "bold", "semibold": "bold",
+    "bold": "bold", "black": "bold",
+}
+
+_MONO_FAMILY = "Courier"  # Tk maps this to a fixed font on every platform
+
+# Requested family -> families tried, in order, when it is not installed.
+# Applications may edit or extend this mapping.
+FALLBACK_CHAINS = {
+    "Segoe UI": ["Selawik", "Noto Sans", "Cantarell", "Ubuntu", "Helvetica Neue"],
+    "SF Pro Display": ["Helvetica Neue", "Inter", "Noto Sans", "Segoe UI"],
+    "Inter": ["Noto Sans", "Segoe UI", "Helvetica Neue", "Roboto"],
+    "Roboto": ["Noto Sans", "Segoe UI", "Helvetica Neue"],
+    "Poppins": ["Montserrat", "Noto Sans", "Segoe UI", "Helvetica Neue"],
+    "Arial Black": ["Arial", "Liberation Sans", "Noto Sans"],
+    "Consolas": ["Cascadia Mono", "DejaVu Sans Mono", "Liberation Mono", "Menlo"],
+    "Courier New": ["Liberation Mono", "DejaVu Sans Mono", "Menlo", "Courier"],
+}
+
+# Tried after a family's own chain
+GENERIC_FALLBACKS = ["DejaVu Sans", "Liberation Sans", "Arial", "Helvetica"]
+
+# Tried after the chain of the mono font's family
+GENERIC_MONO_FALLBACKS = ["DejaVu Sans Mono", "Liberation Mono", "Noto Sans Mono",
+                          "Menlo", "Consolas", "Courier New"]
+
+_FONT_CACHE_FILE = "fonts.json"
+
+# Files and directories whose modification times change whenever fonts
+# are installed or removed
+_FONT_STATE_PATHS = {
+    "win32": [os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+              os.path.join(os.environ.get("LOCALAPPDATA", ""),
+                           "Microsoft", "Windows", "Fonts")],
+    "darwin": ["/System/Library/Fonts", "/Library/Fonts", "~/Library/Fonts"],
+}
+_FONTCONFIG_PATHS = ["/etc/fonts/fonts.conf", "/etc/fonts/conf.d",
+                     "/var/cache/fontconfig", "~/.cache/fontconfig",
+                     "~/.config/fontconfig", "~/.fonts", "~/.local/share/fonts",
+                     "/usr/share/fonts", "/usr/local/share/fonts"]
+
+
+def _parse_font(spec):
+    """Turn a (family, size, *styles) theme token into Font options"""
+    family, size, *styles = spec
+    options = {"family": family, "size": size, "weight": "normal",
+               "slant": "roman", "underline": 0, "overstrike": 0}
+    for style in styles:
+        style = style.lower()
+        if style in _WEIGHTS:
+            options["weight"] = _WEIGHTS[style]
+        elif style == "italic":
+            options["slant"] = "italic"
+        elif style in ("underline", "overstrike"):
+            options[style] = 1
+    return options
+
+
+def font_options(theme):
+    """
+    Compute the named font options of a theme
+
+    body and heading come from the font and heading_font tokens. mono and
+    small use the optional mono_font and small_font tokens, falling back
+    to the body size in a fixed family and one point below the body size.
+
+    Args:
+        theme: Theme dictionary
+
+    Returns:
+        Dictionary mapping font roles to tkinter.font.Font options
+    """
+    body = _parse_font(theme["font"])
+    heading = _parse_font(theme.get("heading_font", theme["font"]))
+    if "mono_font" in theme:
+        mono = _parse_font(theme["mono_font"])
+    else:
+        mono = dict(body, family=_MONO_FAMILY)
+    if "small_font" in theme:
+        small = _parse_font(theme["small_font"])
+    else:
+        small = dict(body, size=max(body["size"] - 1, 7), weight="normal")
+    return {"body": body, "heading": heading, "mono": mono, "small": small}
+
+
+def _font_state():
+    """Fingerprint of the system font configuration"""
+    parts = [sys.platform]
+    for path in _FONT_STATE_PATHS.get(sys.platform, _FONTCONFIG_PATHS):
+        for match in sorted(glob.glob(os.path.expanduser(path))):
+            try:
+                parts.append(f"{match}:{os.stat(match).st_mtime_ns}")
+            except OSError:
+                pass
+    return "|".join(parts)
+
+
+# (font state, family, chain) -> resolved family, shared by all interpreters
+_resolved = {}
+
+
+class FontResolver:
+    """Resolve requested font families against the installed ones"""
+
+    def __init__(self, root):
+        self.tk = root.tk  # swapped by profiling
+        self.state = _font_state()
+        self._families = None  # lowercase name -> installed family, on demand
+        self._disk = None  # resolutions loaded from the on-disk cache
+        self._dirty = False
+
+    def _chain(self, family, monospace=False):
+        generic = GENERIC_MONO_FALLBACKS if monospace else GENERIC_FALLBACKS
+        return [family] + list(FALLBACK_CHAINS.get(family, ())) + [
+            name for name in generic if name != family]
+
+    def _installed(self):
+        if self._families is None:
+            self._families = {
+                name.lower(): name
+                for name in self.tk.splitlist(self.tk.call("font", "families"))}
+        return self._families
+
+    def _load_disk(self):
+        if self._disk is None:
+            data = read_json(_FONT_CACHE_FILE)
+            if isinstance(data, dict) and data.get("state") == self.state:
+                self._disk = data.get("families", {})
+            else:
+                self._disk = {}
+        return self._disk
+
+    def resolve(self, family, monospace=False):
+        """
+        Return the installed family to use for a requested family
+
+        Args:
+            family: Family name from a theme token
+            monospace: Whether the family must stay fixed-width; the chain
+                then ends with GENERIC_MONO_FALLBACKS
+
+        Returns:
+            The first installed family of the fallback chain, or if none
+            is installed the family of TkDefaultFont (Courier, which Tk
+            always maps to a fixed-width font, for monospace)
+        """
+        chain = self._chain(family, monospace)
+        key = (self.state, family, tuple(chain))
+        if key in _resolved:
+            return _resolved[key]
+
+        cached = self._load_disk().get(family)
+        if cached is not None and cached[0] == chain:
+            resolved = cached[1]
+        else:
+            installed = self._installed()
+            for name in chain:
+                if name.lower() in installed:
+                    resolved = installed[name.lower()]
+                    break
+            else:
+                if monospace:
+                    resolved = _MONO_FAMILY
+                else:
+                    resolved = self.tk.call(
+                        "font", "actual", "TkDefaultFont", "-family")
+            self._disk[family] = [chain, resolved]
+            self._dirty = True
+        _resolved[key] = resolved
+        return resolved
+
+    def flush(self):
+        """Write new resolutions to the on-disk cache"""
+        if self._dirty:
+            write_json(_FONT_CACHE_FILE,
+                       {"state": self.state, "families": self._disk})
+            self._dirty = False
+
+
+class NamedFonts:
+    """The named fonts of one interpreter"""
+
+    def __init__(self, root):
+        self.tk = root.tk  # swapped by profiling
+        self.resolver = FontResolver(root)
+        names = set(tkfont.names(root))
+        self.fonts = {
+            role: tkfont.Font(root=root, name=name, exists=name in names)
+            for role, name in FONT_NAMES.items()
+        }
+        self._options = {}  # role -> options last applied
+
+    def apply(self, theme):
+        """
+        Reconfigure the fonts whose options differ for theme
+
+        Args:
+            theme: Theme dictionary
+
+        Returns:
+            Number of fonts reconfigured
+        """
+        changed = 0
+        for role, options in font_options(theme).items():
+            options["family"] = self.resolver.resolve(options["family"],
+                                                      monospace=role == "mono")
+            if self._options.get(role) != options:
+                # Through self.tk rather than Font.configure, so profiling
+                # sees the call
+                args = []
+                for key, value in options.items():
+                    args += ["-" + key, value]
+                self.tk.call("font", "configure", FONT_NAMES[role], *args)
+                self._options[role] = options
+                changed += 1
+        self.resolver.flush()
+        return changed
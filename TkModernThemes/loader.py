@@ -0,0 +1,205 @@
+"""
+Theme files for TkModernThemes
+
+A theme file is a JSON object holding the tokens of one theme:
+
+    {
+        "name": "Brand Dark",
+        "bg": "#101014",
+        "fg": "#f0f0f0",
+        "accent": "#ff5500",
+        ...
+        "font": ["Inter", 10],
+        "heading_font": ["Inter", 16, "bold"]
+    }
+
+The theme is registered in THEMES under its "id" key, or the file name
+without extension. load_theme_file() validates the tokens and compiles
+the ttk style script once. Both are stored in the on-disk cache (see
+cache.py) under a hash of the file name and contents, the library
+version and the source of the style compiler, so a later start loads the
+file without validating or compiling it.
+
+Usage:
+    import TkModernThemes as TKMT
+
+    TKMT.load_theme_dir("themes/")  # index only
+    theme.set_theme("brand_dark")    # loads brand_dark.json
+"""
+
+import hashlib
+import importlib
+import json
+import os
+from functools import lru_cache
+
+from .cache import read_json, write_json
+from .colors import is_color, normalize_theme
+from .styles import TOKEN_DEFAULTS, TOKEN_DEPENDENCIES, resolve_style_table
+
+__all__ = ["ThemeFileError", "REQUIRED_TOKENS", "validate_theme",
+           "load_theme_file", "load_theme_dir"]
+
+# Tokens every theme must define; the others have TOKEN_DEFAULTS
+REQUIRED_TOKENS = sorted(
+    (set(TOKEN_DEPENDENCIES) - set(TOKEN_DEFAULTS)) | {"name", "font", "heading_font"})
+
+_FONT_TOKENS = ("font", "heading_font", "mono_font", "small_font")
+
+# (theme name, token hash) -> compiled script of themes loaded from files
+_scripts = {}
+
+# Modules whose code decides the compiled script of a theme
+_COMPILER_MODULES = ("colors", "palette", "fonts", "styles", "engine")
+
+
+class ThemeFileError(ValueError):
+    """A theme file is missing tokens or has invalid values"""
+
+
+def validate_theme(tokens, source="<theme>"):
+    """
+    Check the tokens of a theme and convert them to the THEMES form
+
+    Args:
+        tokens: Dictionary decoded from a theme file
+        source: File name used in error messages
+
+    Returns:
+        New token dictionary (font lists become tuples)
+
+    Raises:
+        ThemeFileError: If a token is missing or has an invalid value
+    """
+    if not isinstance(tokens, dict):
+        raise ThemeFileError(f"{source}: a theme file must hold a JSON object")
+    missing = [name for name in REQUIRED_TOKENS if name not in tokens]
+    if missing:
+        raise ThemeFileError(f"{source}: missing tokens: {', '.join(missing)}")
+
+    theme = {}
+    for key, value in tokens.items():
+        if key in _FONT_TOKENS:
+            if (not isinstance(value, (list, tuple)) or len(value) < 2
+                    or not isinstance(value[0], str)
+                    or not isinstance(value[1], int)
+                    or not all(isinstance(style, str) for style in value[2:])):
+                raise ThemeFileError(
+                    f"{source}: {key} must be [family, size, *styles], got {value!r}")
+            value = tuple(value)
+        elif key in TOKEN_DEPENDENCIES and key not in TOKEN_DEFAULTS:
+            if not is_color(value):
+                raise ThemeFileError(f"{source}: {key} is not a color: {value!r}")
+        elif key == "radius" and not (isinstance(value, int) and value >= 0):
+            raise ThemeFileError(f"{source}: radius must be a non-negative integer")
+        elif key == "id" and not (isinstance(value, str) and value):
+            raise ThemeFileError(f"{source}: id must be a non-empty string, got {value!r}")
+        theme[key] = value
+    return theme
+
+
+def _compile(theme_name, theme):
+    """Compile the ttk style script of a validated theme"""
+    from .engine import _TTK_THEME_PREFIX, _compile_settings, _settings_from_table
+
+    table = resolve_style_table(normalize_theme(theme))
+    return _compile_settings(_TTK_THEME_PREFIX + theme_name,
+                             _settings_from_table(table)), len(table)
+
+
+@lru_cache(maxsize=None)
+def _compiler_fingerprint():
+    """Hash of the style compiler's source, so cached scripts follow its changes"""
+    from . import __version__
+
+    digest = hashlib.sha1(__version__.encode("utf-8"))
+    for name in _COMPILER_MODULES:
+        module = importlib.import_module("." + name, __package__)
+        try:
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+        except (OSError, TypeError):
+            pass  # no source (frozen install): the version alone
+    return digest.hexdigest()
+
+
+def load_theme_file(path, register=True):
+    """
+    Load a theme file, using the on-disk cache when possible
+
+    Args:
+        path: Path of the JSON theme file
+        register: Whether to add the theme to THEMES
+
+    Returns:
+        (theme name, token dictionary) tuple
+
+    Raises:
+        ThemeFileError: If the file is not valid JSON or not a valid theme
+        OSError: If the file cannot be read
+    """
+    from . import THEMES
+    from .engine import _token_hash
+
+    with open(path, "rb") as f:
+        data = f.read()
+    # The file name is the default theme name, which the script embeds
+    default_name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(b"\0".join([
+        _compiler_fingerprint().encode("ascii"), default_name.encode("utf-8"), data,
+    ])).hexdigest()
+    cache_name = os.path.join("themes", digest + ".json")
+
+    entry = read_json(cache_name)
+    if entry is not None:
+        theme = {key: tuple(value) if key in _FONT_TOKENS else value
+                 for key, value in entry["tokens"].items()}
+        theme_name, script, rows = entry["id"], entry["script"], entry["rows"]
+    else:
+        try:
+            tokens = json.loads(data.decode("utf-8"))
+        except ValueError as e:
+            raise ThemeFileError(f"{path}: invalid JSON: {e}") from None
+        theme = validate_theme(tokens, path)
+        theme_name = theme.pop("id", default_name)
+        script, rows = _compile(theme_name, theme)
+        write_json(cache_name, {"id": theme_name, "tokens": theme,
+                                "script": script, "rows": rows})
+
+    _scripts[(theme_name, _token_hash(theme))] = (script, rows)
+    if register:
+        THEMES[theme_name] = theme
+    return theme_name, theme
+
+
+def load_theme_dir(directory):
+    """
+    Add every *.json theme file of a directory to THEMES
+
+    The files are only indexed; each one is loaded (from the cache, or
+    validated and compiled) when its theme is first requested.
+
+    Args:
+        directory: Directory holding theme files
+
+    Returns:
+        Sorted list of the theme names
+    """
+    from . import THEMES
+
+    return THEMES.add_directory(directory)
+
+
+def precompiled_script(theme_name, token_hash):
+    """
+    Return the script compiled by the loader for a theme version
+
+    Args:
+        theme_name: Name of the theme in THEMES
+        token_hash: Content hash of its tokens
+
+    Returns:
+        (script, row count) tuple, or None if the theme was not loaded
+        from a file or its tokens were changed since
+    """
+    return _scripts.get((theme_name, token_hash))
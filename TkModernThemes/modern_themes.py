@@ -3,74 +3,63 @@ ModernThemes - A modern theme manager for CustomTkinter
 Inspired by PySide6 and Nexus UI design
 """
 
-import customtkinter as ctk
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any, Tuple
+
+from . import THEMES as _SHARED_THEMES
+from .catalog import ThemeCatalog
+from .palette import derive_palette
+
+if TYPE_CHECKING:
+    import customtkinter as ctk
 
 __version__ = "3.0.0"
 __author__ = "TkModernThemes"
 __all__ = ["ModernThemes", "THEMES", "create_card", "create_sidebar"]
 
-# Theme definitions with modern color schemes
-THEMES = {
-    "nexus_dark": {
-        "name": "Nexus Dark",
-        "bg": "#0a0a0a",
-        "fg": "#e4e4e7",
-        "accent": "#3b82f6",
-        "secondary": "#8b5cf6",
-        "surface": "#18181b",
-        "surface_variant": "#27272a",
-        "border": "#3f3f46",
-        "hover": "#1e293b",
-        "success": "#22c55e",
-        "warning": "#f59e0b",
-        "error": "#ef4444",
-        "font": ("Segoe UI", 12),
-        "heading_font": ("Segoe UI", 16, "bold"),
-        "radius": 8
-    },
-    "nexus_light": {
-        "name": "Nexus Light",
-        "bg": "#ffffff",
-        "fg": "#18181b",
-        "accent": "#2563eb",
-        "secondary": "#7c3aed",
-        "surface": "#f4f4f5",
-        "surface_variant": "#e4e4e7",
-        "border": "#d4d4d8",
-        "hover": "#f1f5f9",
-        "success": "#16a34a",
-        "warning": "#ea580c",
-        "error": "#dc2626",
-        "font": ("Segoe UI", 12),
-        "heading_font": ("Segoe UI", 16, "bold"),
-        "radius": 8
-    },
-    "cyberpunk": {
-        "name": "Cyberpunk",
-        "bg": "#0a0a0f",
-        "fg": "#00ff9d",
-        "accent": "#ff2a6d",
-        "secondary": "#ff9d00",
-        "surface": "#151520",
-        "surface_variant": "#1e1e2e",
-        "border": "#2a2a40",
-        "hover": "#2a1a2e",
-        "success": "#00e6c7",
-        "warning": "#ffcc00",
-        "error": "#ff2a6d",
-        "font": ("Courier New", 12, "bold"),
-        "heading_font": ("Arial Black", 16, "bold"),
-        "radius": 6
-    }
-}
+# Themes offered for CustomTkinter. They share the ttk definitions; only
+# the body font is larger, as CTk widgets are sized for 12 pt text
+_CTK_THEMES = ("nexus_dark", "nexus_light", "cyberpunk")
+_CTK_FONT_SIZE = 12
+
+_ctk = None  # customtkinter, imported by the first ModernThemes(...)
+
+
+def _backend():
+    """Import CustomTkinter on first use"""
+    global _ctk
+    if _ctk is None:
+        try:
+            import customtkinter
+        except ImportError as e:
+            raise ImportError(
+                "ModernThemes needs CustomTkinter: pip install customtkinter"
+            ) from e
+        _ctk = customtkinter
+    return _ctk
+
+
+def _ctk_theme(name: str) -> Dict[str, Any]:
+    """Copy a shared theme with the CustomTkinter body font size"""
+    theme = dict(_SHARED_THEMES[name])
+    family, _, *styles = theme["font"]
+    theme["font"] = (family, _CTK_FONT_SIZE, *styles)
+    return theme
+
+
+# Theme definitions, loaded from the shared catalog on first access
+THEMES = ThemeCatalog()
+for _name in _CTK_THEMES:
+    THEMES.register(_SHARED_THEMES.entry(_name),
+                    lambda name=_name: _ctk_theme(name))
+del _name
+
 
 class ModernThemes:
     """
     Modern theme manager for CustomTkinter applications
     """
     
-    def __init__(self, root: ctk.CTk):
+    def __init__(self, root: "ctk.CTk"):
         """
         Initialize the theme manager
         
@@ -80,6 +69,7 @@ class ModernThemes:
         self.root = root
         self.current_theme = None
         self._theme_data = None
+        self._ctk = _backend()
     
     def set_theme(self, theme_name: str) -> None:
         """
@@ -101,8 +91,9 @@ class ModernThemes:
         self.current_theme = theme_name
         self._theme_data = theme
         
-        # Set appearance mode based on theme name
-        appearance_mode = "dark" if "dark" in theme_name.lower() else "light"
+        # Set appearance mode from the theme background
+        ctk = self._ctk
+        appearance_mode = "dark" if THEMES.entry(theme_name).dark else "light"
         ctk.set_appearance_mode(appearance_mode)
         
         # Set default color theme
@@ -113,7 +104,9 @@ class ModernThemes:
     
     def _apply_theme_styles(self) -> None:
         """Apply custom styles based on the current theme"""
+        ctk = self._ctk
         theme = self._theme_data
+        palette = derive_palette(theme)
         
         # Configure button styles
         ctk.set_widget_scaling(1.0)  # Reset to default scaling
@@ -143,7 +136,7 @@ class ModernThemes:
             "corner_radius": theme["radius"],
             "border_width": 1,
             "fg_color": theme["accent"],
-            "hover_color": self._adjust_color(theme["accent"], -20),
+            "hover_color": palette["accent"]["hover"],
             "border_color": theme["border"],
             "text_color": "white",
             "font": theme["font"]
@@ -172,26 +165,6 @@ class ModernThemes:
             "font": theme["font"]
         }
     
-    def _adjust_color(self, color: str, amount: int) -> str:
-        """Adjust color brightness by amount (-255 to 255)"""
-        import colorsys
-        
-        # Convert hex to RGB
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        
-        # Convert to HSV
-        h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
-        
-        # Adjust value (brightness)
-        v = max(0, min(1, v + amount/255))
-        
-        # Convert back to RGB
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        
-        # Convert to hex
-        return f'#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}'
-    
     def get_theme_list(self) -> List[str]:
         """Return list of available theme names"""
         return list(THEMES.keys())
@@ -214,7 +187,7 @@ class ModernThemes:
             return self._theme_data.copy()
         return THEMES.get(theme_name, {})
     
-    def create_card(self, parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
+    def create_card(self, parent: "ctk.CTk", **kwargs) -> "ctk.CTkFrame":
         """
         Create a styled card frame
         
@@ -226,7 +199,7 @@ class ModernThemes:
             CTkFrame with Card style
         """
         theme = self._theme_data
-        return ctk.CTkFrame(
+        return self._ctk.CTkFrame(
             parent,
             corner_radius=theme["radius"],
             fg_color=theme["surface"],
@@ -235,7 +208,7 @@ class ModernThemes:
             **kwargs
         )
     
-    def create_sidebar(self, parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
+    def create_sidebar(self, parent: "ctk.CTk", **kwargs) -> "ctk.CTkFrame":
         """
         Create a styled sidebar
         
@@ -247,7 +220,7 @@ class ModernThemes:
             CTkFrame with Sidebar style
         """
         theme = self._theme_data
-        return ctk.CTkFrame(
+        return self._ctk.CTkFrame(
             parent,
             corner_radius=0,
             fg_color=theme["surface_variant"],
@@ -255,7 +228,7 @@ class ModernThemes:
         )
 
 
-def create_card(parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
+def create_card(parent: "ctk.CTk", **kwargs) -> "ctk.CTkFrame":
     """
     Utility function to create a styled card frame
     
@@ -266,7 +239,7 @@ def create_card(parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
     Returns:
         CTkFrame with Card style
     """
-    return ctk.CTkFrame(
+    return _backend().CTkFrame(
         parent,
         corner_radius=8,
         fg_color=("gray90", "gray16"),
@@ -274,7 +247,7 @@ def create_card(parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
     )
 
 
-def create_sidebar(parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
+def create_sidebar(parent: "ctk.CTk", **kwargs) -> "ctk.CTkFrame":
     """
     Utility function to create a styled sidebar
     
@@ -285,7 +258,7 @@ def create_sidebar(parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
     Returns:
         CTkFrame with Sidebar style
     """
-    return ctk.CTkFrame(
+    return _backend().CTkFrame(
         parent,
         corner_radius=0,
         fg_color=("gray85", "gray20"),
@@ -295,7 +268,8 @@ def create_sidebar(parent: ctk.CTk, **kwargs) -> ctk.CTkFrame:
 
 # Example usage
 if __name__ == "__main__":
-    app = ctk.CTk()
+    customtkinter = _backend()
+    app = customtkinter.CTk()
     app.title("Modern Themes Demo")
     app.geometry("1000x700")
     
@@ -314,11 +288,11 @@ if __name__ == "__main__":
     sidebar.grid(row=0, column=0, sticky="nsew")
     
     # Add theme selector
-    theme_label = ctk.CTkLabel(sidebar, text="Select Theme:")
+    theme_label = customtkinter.CTkLabel(sidebar, text="Select Theme:")
     theme_label.pack(padx=20, pady=(20, 10), anchor="w")
     
-    theme_var = ctk.StringVar(value=themes.get_current_theme())
-    theme_menu = ctk.CTkOptionMenu(
+    theme_var = customtkinter.StringVar(value=themes.get_current_theme())
+    theme_menu = customtkinter.CTkOptionMenu(
         sidebar,
         values=themes.get_theme_list(),
         command=lambda x: themes.set_theme(x),
@@ -327,15 +301,15 @@ if __name__ == "__main__":
     theme_menu.pack(padx=20, pady=(0, 20), fill="x")
     
     # Create main content
-    main_frame = ctk.CTkFrame(app)
+    main_frame = customtkinter.CTkFrame(app)
     main_frame.grid(row=0, column=1, padx=20, pady=20, sticky="nsew")
     main_frame.grid_columnconfigure(0, weight=1)
     
     # Add sample content
-    title = ctk.CTkLabel(
+    title = customtkinter.CTkLabel(
         main_frame,
         text="ModernThemes for CustomTkinter",
-        font=ctk.CTkFont(size=24, weight="bold")
+        font=customtkinter.CTkFont(size=24, weight="bold")
     )
     title.pack(pady=(20, 10))
     
@@ -343,10 +317,10 @@ if __name__ == "__main__":
     card.pack(pady=10, padx=20, fill="both", expand=True)
     
     # Add some sample widgets
-    button = ctk.CTkButton(card, text="Click Me!")
+    button = customtkinter.CTkButton(card, text="Click Me!")
     button.pack(pady=20)
     
-    entry = ctk.CTkEntry(card, placeholder_text="Type something...")
+    entry = customtkinter.CTkEntry(card, placeholder_text="Type something...")
     entry.pack(pady=10, padx=20, fill="x")
     
     app.mainloop()
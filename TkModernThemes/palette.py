@@ -0,0 +1,214 @@
+"""
+Derived color palette for TkModernThemes
+
+Interactive shades (hover, pressed, disabled, muted text, focus ring) are
+derived from the theme tokens in the OKLab color space, where equal
+lightness steps look equally large for every hue. Each shade is memoized
+per (color, operation, amount), so switching between themes only looks up
+shades computed before.
+
+Color animations use gradient(): the colors of every step between two
+colors, computed once per (start, end, steps, space) and memoized, so a
+running animation only indexes into the table.
+
+Usage:
+    palette = derive_palette(theme)
+    palette["accent"]["hover"]
+"""
+
+from functools import lru_cache
+
+from .colors import format_hex, is_color, to_rgb
+
+__all__ = ["VARIANTS", "to_oklab", "from_oklab", "adjust", "mix",
+           "gradient", "is_dark_color", "variant", "derive_palette"]
+
+# variant -> (operation, amount); lightness steps move away from the
+# background (lighter on dark themes, darker on light ones) and mixes
+# move towards it
+VARIANTS = {
+    "hover": ("lightness", 0.06),
+    "pressed": ("lightness", 0.12),
+    "focus": ("lightness", 0.16),
+    "muted": ("mix", 0.4),
+    "disabled": ("mix", 0.6),
+}
+
+# Background lightness below which a theme counts as dark
+_DARK_LIGHTNESS = 0.6
+
+
+def _to_linear(channel):
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _from_linear(value):
+    value = min(1.0, max(0.0, value))
+    c = value * 12.92 if value <= 0.0031308 else 1.055 * value ** (1 / 2.4) - 0.055
+    return round(c * 255)
+
+
+@lru_cache(maxsize=1024)
+def to_oklab(color):
+    """
+    Convert a color string to OKLab
+
+    Args:
+        color: Color string in any format colors.parse_color accepts
+
+    Returns:
+        (L, a, b) tuple; L is 0 (black) to 1 (white)
+    """
+    r, g, b = (_to_linear(c) for c in to_rgb(color))
+    l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+            1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+            0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s)
+
+
+def from_oklab(lab):
+    """
+    Convert an OKLab triple to #rrggbb, clipping to the sRGB gamut
+
+    Args:
+        lab: (L, a, b) tuple
+
+    Returns:
+        #rrggbb string
+    """
+    L, a, b = lab
+    l = (L + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m = (L - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s = (L - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return format_hex((
+        _from_linear(4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s),
+        _from_linear(-1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s),
+        _from_linear(-0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s),
+    ))
+
+
+@lru_cache(maxsize=4096)
+def adjust(color, operation, amount):
+    """
+    Apply one OKLab operation to a color
+
+    Args:
+        color: Color string
+        operation: "lightness" (add amount to L) or "chroma" (scale the
+            chroma by 1 + amount)
+        amount: Operation amount
+
+    Returns:
+        #rrggbb string
+
+    Raises:
+        ValueError: If operation is unknown
+    """
+    L, a, b = to_oklab(color)
+    if operation == "lightness":
+        L = min(1.0, max(0.0, L + amount))
+    elif operation == "chroma":
+        a, b = a * (1 + amount), b * (1 + amount)
+    else:
+        raise ValueError(f"Unknown palette operation: {operation!r}")
+    return from_oklab((L, a, b))
+
+
+@lru_cache(maxsize=4096)
+def mix(color, other, amount):
+    """
+    Interpolate from color towards other in OKLab
+
+    Args:
+        color: Start color string
+        other: End color string
+        amount: 0 returns color, 1 returns other
+
+    Returns:
+        #rrggbb string
+    """
+    start, end = to_oklab(color), to_oklab(other)
+    return from_oklab(tuple(s + (e - s) * amount for s, e in zip(start, end)))
+
+
+def _format_rgb(rgb):
+    return format_hex([round(c) for c in rgb])
+
+
+@lru_cache(maxsize=256)
+def gradient(start, end, steps, space="oklab"):
+    """
+    Interpolate between two colors in equal steps
+
+    Args:
+        start: Start color string
+        end: End color string
+        steps: Number of steps; the result holds steps + 1 colors
+        space: "oklab" (perceptually even steps) or "rgb"
+
+    Returns:
+        Tuple of #rrggbb strings from start to end
+
+    Raises:
+        ValueError: If space is unknown
+    """
+    if space == "oklab":
+        first, last, convert = to_oklab(start), to_oklab(end), from_oklab
+    elif space == "rgb":
+        first, last, convert = to_rgb(start), to_rgb(end), _format_rgb
+    else:
+        raise ValueError(f"Unknown color space: {space!r}")
+    return tuple(
+        convert(tuple(s + (e - s) * step / steps for s, e in zip(first, last)))
+        for step in range(steps + 1))
+
+
+def is_dark_color(color):
+    """Return True if a background color makes a dark theme"""
+    return to_oklab(color)[0] < _DARK_LIGHTNESS
+
+
+def variant(color, bg, name):
+    """
+    Derive one palette variant of a color
+
+    Args:
+        color: Token color
+        bg: Theme background, which sets the direction of the shades
+        name: Variant name, one of VARIANTS
+
+    Returns:
+        #rrggbb string
+    """
+    operation, amount = VARIANTS[name]
+    if operation == "mix":
+        return mix(color, bg, amount)
+    if not is_dark_color(bg):
+        amount = -amount
+    return adjust(color, operation, amount)
+
+
+@lru_cache(maxsize=64)
+def _derive(items):
+    bg = dict(items)["bg"]
+    return {key: {name: variant(value, bg, name) for name in VARIANTS}
+            for key, value in items}
+
+
+def derive_palette(theme):
+    """
+    Derive every variant of every color token of a theme in one pass
+
+    Args:
+        theme: Theme dictionary with opaque colors (see
+            colors.normalize_theme) and a "bg" token
+
+    Returns:
+        Dictionary mapping token names to {variant: #rrggbb} dictionaries
+    """
+    items = tuple(sorted((key, value) for key, value in theme.items()
+                         if is_color(value)))
+    return _derive(items)
@@ -0,0 +1,163 @@
+"""
+Tcl call profiling for TkModernThemes
+
+ThemedTk.enable_profiling() returns a ProfileReport. While it is enabled,
+set_theme, update_theme_colors and the create_* helpers talk to Tcl
+through a ProfilingTcl stand-in that counts and times every call/eval.
+
+Usage:
+    report = theme.enable_profiling()
+    theme.set_theme("nexus_dark")
+    print(report.as_dict())
+"""
+
+import heapq
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+__all__ = ["ProfileReport", "TclCall"]
+
+# ttk::style subcommands whose third word is a style name
+_STYLE_SUBCOMMANDS = {"configure", "map", "layout", "lookup"}
+
+TclCall = namedtuple("TclCall", ["seconds", "command", "style"])
+
+
+class ProfileReport:
+    """Tcl command counts and timings collected while profiling"""
+
+    def __init__(self, max_slowest=10):
+        self.max_slowest = max_slowest
+        self.commands = 0
+        self.total_time = 0.0
+        self.style_commands = {}  # style name -> Tcl commands
+        self.style_times = {}  # style name -> cumulative seconds
+        self._slowest = []  # min-heap of (seconds, sequence, TclCall)
+        self._style = None  # style the current script is attributed to
+
+    @property
+    def slowest(self):
+        """Slowest recorded calls, slowest first"""
+        return [call for _, _, call in sorted(self._slowest, reverse=True)]
+
+    @contextmanager
+    def attribute(self, style):
+        """Attribute the Tcl calls made inside the block to style"""
+        previous, self._style = self._style, style
+        try:
+            yield
+        finally:
+            self._style = previous
+
+    def record(self, seconds, command, style=None):
+        """
+        Record one Tcl call
+
+        Args:
+            seconds: Wall time of the call
+            command: Short description of the command
+            style: ttk style name the call applies to, if any
+        """
+        style = style or self._style
+        self.commands += 1
+        self.total_time += seconds
+        if style is not None:
+            self.style_commands[style] = self.style_commands.get(style, 0) + 1
+            self.style_times[style] = self.style_times.get(style, 0.0) + seconds
+        if self.max_slowest:
+            entry = (seconds, self.commands, TclCall(seconds, command, style))
+            if len(self._slowest) < self.max_slowest:
+                heapq.heappush(self._slowest, entry)
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def reset(self):
+        """Clear all recorded data"""
+        self.__init__(self.max_slowest)
+
+    def as_dict(self):
+        """
+        Get the report as plain data
+
+        Returns:
+            Dictionary with commands, total_time, style_commands,
+            style_times and slowest (list of dictionaries)
+        """
+        return {
+            "commands": self.commands,
+            "total_time": self.total_time,
+            "style_commands": dict(self.style_commands),
+            "style_times": dict(self.style_times),
+            "slowest": [call._asdict() for call in self.slowest],
+        }
+
+
+def _describe(args, limit=120):
+    """Short printable form of a Tcl command"""
+    text = " ".join(" ".join(str(arg).split()) for arg in args)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+class ProfilingTcl:
+    """Stand-in for a tkapp object that records every call and eval"""
+
+    def __init__(self, tk, report):
+        self._tk = tk
+        self._report = report
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        style = None
+        if (len(args) > 2 and str(args[0]) == "ttk::style"
+                and str(args[1]) in _STYLE_SUBCOMMANDS):
+            style = str(args[2])
+        start = time.perf_counter()
+        try:
+            return self._tk.call(*args)
+        finally:
+            self._report.record(time.perf_counter() - start,
+                                _describe(args), style)
+
+    def eval(self, script):
+        start = time.perf_counter()
+        try:
+            return self._tk.eval(script)
+        finally:
+            self._report.record(time.perf_counter() - start,
+                                _describe((script,)))
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+@contextmanager
+def profiled(report, *widgets):
+    """
+    Route the Tcl calls of widgets through a ProfilingTcl for the block
+
+    Args:
+        report: ProfileReport to record into
+        *widgets: Objects with a ``tk`` attribute (widgets, ttk.Style)
+
+    Yields:
+        Callable that restores the real interpreter on a widget created
+        inside the block (new widgets copy their master's ``tk``)
+    """
+    swapped = []
+    for widget in widgets:
+        if not isinstance(widget.tk, ProfilingTcl):
+            swapped.append((widget, widget.tk))
+            widget.tk = ProfilingTcl(widget.tk, report)
+
+    def release(widget):
+        if isinstance(widget.tk, ProfilingTcl):
+            widget.tk = widget.tk._tk
+        return widget
+
+    try:
+        yield release
+    finally:
+        for widget, tk in reversed(swapped):
+            widget.tk = tk
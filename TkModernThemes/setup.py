@@ -69,6 +69,10 @@ setup(
         # tkinter comes with Python standard library
     ],
     extras_require={
+        # Only needed by TkModernThemes.modern_themes.ModernThemes
+        "customtkinter": [
+            "customtkinter>=5.0.0",
+        ],
         "dev": [
             "twine>=4.0.0",
             "wheel>=0.37.0",
@@ -0,0 +1,488 @@
+"""
+Declarative style table for TkModernThemes
+
+Every ttk style option a theme sets is one row of STYLE_TABLE:
+
+    (style, kind, option, value)
+
+kind is "configure", "map" or "layout" (option is None for layouts).
+value is either a constant or an expression over theme tokens (Token,
+Shade, States, Computed) that the theme compiler resolves per theme. An
+expression resolving to None leaves the option unset for that theme.
+"""
+
+from .colors import is_color
+from .fonts import FONT_NAMES
+from .palette import variant
+
+__all__ = ["STYLE_TABLE", "STYLE_ROWS", "TOKEN_DEPENDENCIES", "TOKEN_DEFAULTS",
+           "Computed", "Token", "Shade", "States",
+           "resolve_style_table", "dependent_rows"]
+
+# Values used for optional tokens a theme does not define
+TOKEN_DEFAULTS = {
+    "blur": False,
+    "shadow": None,
+    "radius": 4,
+}
+
+
+def token_value(theme, name):
+    """Return a token of a theme, falling back to TOKEN_DEFAULTS"""
+    if name in theme:
+        return theme[name]
+    return TOKEN_DEFAULTS[name]
+
+
+class Computed:
+    """Style value computed by func from the named theme tokens"""
+
+    def __init__(self, func, *tokens):
+        self.func = func
+        self.tokens = tokens
+
+    def resolve(self, theme):
+        """Evaluate the expression for a theme"""
+        return self.func(*(token_value(theme, name) for name in self.tokens))
+
+
+class Token(Computed):
+    """The value of a single theme token"""
+
+    def __init__(self, name):
+        super().__init__(_identity, name)
+
+
+class Shade(Computed):
+    """A palette variant (hover, pressed, ...) of a token color"""
+
+    def __init__(self, name, variant_name):
+        super().__init__(lambda color, bg: _shade(color, bg, variant_name),
+                         name, "bg")
+
+
+def _shade(color, bg, variant_name):
+    # Tk color names ("white") cannot be shaded without an interpreter to
+    # resolve them, so they are used unchanged
+    if not (is_color(color) and is_color(bg)):
+        return color
+    return variant(color, bg, variant_name)
+
+
+class States(Computed):
+    """State-dependent values of a style map option"""
+
+    def __init__(self, *statespecs):
+        self.statespecs = statespecs
+        tokens = []
+        for *_, value in statespecs:
+            for name in getattr(value, "tokens", ()):
+                if name not in tokens:
+                    tokens.append(name)
+        self.tokens = tuple(tokens)
+
+    def resolve(self, theme):
+        """Evaluate every state value for a theme"""
+        return [(*state, resolve_value(value, theme))
+                for *state, value in self.statespecs]
+
+
+def resolve_value(value, theme):
+    """Resolve a table value (constant or expression) for a theme"""
+    if isinstance(value, Computed):
+        return value.resolve(theme)
+    return value
+
+
+def _identity(value):
+    return value
+
+
+def _frame_layout(radius):
+    """TFrame layout with rounded corners"""
+    return [
+        ("Frame.border", {
+            "sticky": "nswe",
+            "border": str(radius),
+            "children": [
+                ("Frame.padding", {
+                    "sticky": "nswe",
+                    "children": [("Frame.background", {"sticky": "nswe"})],
+                }),
+            ],
+        }),
+    ]
+
+
+def _has_shadow(shadow, blur):
+    # Note: for more advanced shadow effects we would need custom widgets
+    # with Canvas drawing; ttk only gets the flat, padded card
+    return bool(shadow) and not blur
+
+
+def _card_borderwidth(shadow, blur):
+    return 0 if _has_shadow(shadow, blur) else 1
+
+
+def _card_bordercolor(border, shadow, blur):
+    return None if _has_shadow(shadow, blur) else border
+
+
+def _card_padding(shadow, blur):
+    return (10, 10, 10, 10) if _has_shadow(shadow, blur) else None
+
+
+STYLE_TABLE = [
+    # Base elements
+    (".", "configure", "background", Token("bg")),
+    (".", "configure", "foreground", Token("fg")),
+    (".", "configure", "fieldbackground", Token("surface")),
+    (".", "configure", "bordercolor", Token("border")),
+    (".", "configure", "font", FONT_NAMES["body"]),
+    (".", "configure", "borderwidth", 1),
+    (".", "configure", "relief", "flat"),
+
+    # Frames; TFrame gets rounded corners from the radius token
+    ("TFrame", "layout", None, Computed(_frame_layout, "radius")),
+    ("TFrame", "configure", "background", Token("bg")),
+    ("TFrame", "configure", "borderwidth", 0),
+    ("TFrame", "configure", "relief", "flat"),
+
+    # Card frame - elevated surface. Themes with a shadow (neomorphism) drop
+    # the border and get extra padding instead
+    ("Card.TFrame", "configure", "background", Token("surface")),
+    ("Card.TFrame", "configure", "relief", "flat"),
+    ("Card.TFrame", "configure", "borderwidth",
+     Computed(_card_borderwidth, "shadow", "blur")),
+    ("Card.TFrame", "configure", "bordercolor",
+     Computed(_card_bordercolor, "border", "shadow", "blur")),
+    ("Card.TFrame", "configure", "padding",
+     Computed(_card_padding, "shadow", "blur")),
+    ("Sidebar.TFrame", "configure", "background", Token("surface_variant")),
+    ("Sidebar.TFrame", "configure", "relief", "flat"),
+    ("Toolbar.TFrame", "configure", "background", Token("surface")),
+    ("Toolbar.TFrame", "configure", "relief", "flat"),
+    ("Toolbar.TFrame", "configure", "borderwidth", 0),
+
+    # Labels
+    ("TLabel", "configure", "background", Token("bg")),
+    ("TLabel", "configure", "foreground", Token("fg")),
+    ("TLabel", "configure", "font", FONT_NAMES["body"]),
+    ("TLabel", "configure", "padding", 2),
+    ("Heading.TLabel", "configure", "font", FONT_NAMES["heading"]),
+    ("Heading.TLabel", "configure", "foreground", Token("accent")),
+    ("Heading.TLabel", "configure", "background", Token("bg")),
+    ("Mono.TLabel", "configure", "font", FONT_NAMES["mono"]),
+    ("Small.TLabel", "configure", "font", FONT_NAMES["small"]),
+    ("Card.TLabel", "configure", "background", Token("surface")),
+    ("Card.TLabel", "configure", "foreground", Token("fg")),
+    ("Sidebar.TLabel", "configure", "background", Token("surface_variant")),
+    ("Sidebar.TLabel", "configure", "foreground", Token("fg")),
+    ("Muted.TLabel", "configure", "background", Token("bg")),
+    ("Muted.TLabel", "configure", "foreground", Token("border")),
+    ("Success.TLabel", "configure", "background", Token("bg")),
+    ("Success.TLabel", "configure", "foreground", Token("success")),
+    ("Warning.TLabel", "configure", "background", Token("bg")),
+    ("Warning.TLabel", "configure", "foreground", Token("warning")),
+    ("Error.TLabel", "configure", "background", Token("bg")),
+    ("Error.TLabel", "configure", "foreground", Token("error")),
+
+    # Buttons
+    ("TButton", "configure", "background", Token("accent")),
+    ("TButton", "configure", "foreground", "#ffffff"),
+    ("TButton", "configure", "borderwidth", 0),
+    ("TButton", "configure", "focuscolor", Token("accent")),
+    ("TButton", "configure", "padding", (16, 8)),
+    ("TButton", "configure", "font", FONT_NAMES["body"]),
+    ("TButton", "configure", "relief", "flat"),
+    ("TButton", "map", "background",
+     States(("active", Shade("accent", "hover")),
+            ("pressed", Shade("accent", "pressed")),
+            ("disabled", Shade("accent", "disabled")))),
+    ("TButton", "map", "foreground", States(("disabled", Token("fg")))),
+    ("TButton", "map", "relief", States(("pressed", "flat"))),
+    ("Secondary.TButton", "configure", "background", Token("surface")),
+    ("Secondary.TButton", "configure", "foreground", Token("fg")),
+    ("Secondary.TButton", "configure", "borderwidth", 1),
+    ("Secondary.TButton", "configure", "bordercolor", Token("border")),
+    ("Secondary.TButton", "configure", "padding", (16, 8)),
+    ("Secondary.TButton", "map", "background",
+     States(("active", Token("hover")), ("pressed", Shade("surface", "pressed")))),
+    ("Secondary.TButton", "map", "bordercolor",
+     States(("active", Token("accent")), ("pressed", Token("accent")))),
+    ("Accent.TButton", "configure", "background", Token("secondary")),
+    ("Accent.TButton", "configure", "foreground", "#ffffff"),
+    ("Accent.TButton", "configure", "borderwidth", 0),
+    ("Accent.TButton", "configure", "padding", (16, 8)),
+    ("Accent.TButton", "map", "background",
+     States(("active", Token("accent")),
+            ("pressed", Shade("secondary", "pressed")))),
+    ("Success.TButton", "configure", "background", Token("success")),
+    ("Success.TButton", "configure", "foreground", "#ffffff"),
+    ("Success.TButton", "configure", "borderwidth", 0),
+    ("Success.TButton", "configure", "padding", (16, 8)),
+    ("Success.TButton", "configure", "focuscolor", Token("success")),
+    ("Success.TButton", "configure", "font", FONT_NAMES["body"]),
+    ("Success.TButton", "configure", "relief", "flat"),
+    ("Success.TButton", "map", "background",
+     States(("active", Shade("success", "hover")),
+            ("pressed", Shade("success", "pressed")),
+            ("disabled", Shade("success", "disabled")))),
+    ("Success.TButton", "map", "foreground",
+     States(("disabled", Token("fg")))),
+    ("Success.TButton", "map", "relief", States(("pressed", "flat"))),
+    ("Warning.TButton", "configure", "background", Token("warning")),
+    ("Warning.TButton", "configure", "foreground", "#ffffff"),
+    ("Warning.TButton", "configure", "borderwidth", 0),
+    ("Warning.TButton", "configure", "padding", (16, 8)),
+    ("Warning.TButton", "configure", "focuscolor", Token("warning")),
+    ("Warning.TButton", "configure", "font", FONT_NAMES["body"]),
+    ("Warning.TButton", "configure", "relief", "flat"),
+    ("Warning.TButton", "map", "background",
+     States(("active", Shade("warning", "hover")),
+            ("pressed", Shade("warning", "pressed")),
+            ("disabled", Shade("warning", "disabled")))),
+    ("Warning.TButton", "map", "foreground",
+     States(("disabled", Token("fg")))),
+    ("Warning.TButton", "map", "relief", States(("pressed", "flat"))),
+    ("Error.TButton", "configure", "background", Token("error")),
+    ("Error.TButton", "configure", "foreground", "#ffffff"),
+    ("Error.TButton", "configure", "borderwidth", 0),
+    ("Error.TButton", "configure", "padding", (16, 8)),
+    ("Error.TButton", "configure", "focuscolor", Token("error")),
+    ("Error.TButton", "configure", "font", FONT_NAMES["body"]),
+    ("Error.TButton", "configure", "relief", "flat"),
+    ("Error.TButton", "map", "background",
+     States(("active", Shade("error", "hover")),
+            ("pressed", Shade("error", "pressed")),
+            ("disabled", Shade("error", "disabled")))),
+    ("Error.TButton", "map", "foreground", States(("disabled", Token("fg")))),
+    ("Error.TButton", "map", "relief", States(("pressed", "flat"))),
+
+    # Entry fields
+    ("TEntry", "configure", "fieldbackground", Token("surface")),
+    ("TEntry", "configure", "foreground", Token("fg")),
+    ("TEntry", "configure", "bordercolor", Token("border")),
+    ("TEntry", "configure", "lightcolor", Token("surface")),
+    ("TEntry", "configure", "darkcolor", Token("surface")),
+    ("TEntry", "configure", "insertcolor", Token("accent")),
+    ("TEntry", "configure", "padding", 10),
+    ("TEntry", "configure", "relief", "flat"),
+    ("TEntry", "map", "fieldbackground",
+     States(("focus", Token("surface")),
+            ("readonly", Token("surface_variant")))),
+    ("TEntry", "map", "bordercolor",
+     States(("focus", Token("accent")), ("invalid", Token("error")))),
+    ("TEntry", "map", "lightcolor", States(("focus", Token("accent")))),
+    ("TEntry", "map", "darkcolor", States(("focus", Token("accent")))),
+
+    # Check and radio buttons
+    ("TCheckbutton", "configure", "background", Token("bg")),
+    ("TCheckbutton", "configure", "foreground", Token("fg")),
+    ("TCheckbutton", "configure", "indicatorcolor", Token("surface")),
+    ("TCheckbutton", "configure", "bordercolor", Token("border")),
+    ("TCheckbutton", "configure", "padding", 5),
+    ("TCheckbutton", "map", "indicatorcolor",
+     States(("selected", Token("accent")), ("active", Token("hover")))),
+    ("TCheckbutton", "map", "background", States(("active", Token("bg")))),
+    ("Card.TCheckbutton", "configure", "background", Token("surface")),
+    ("Card.TCheckbutton", "configure", "foreground", Token("fg")),
+    ("Card.TCheckbutton", "map", "background",
+     States(("active", Token("surface")))),
+    ("TRadiobutton", "configure", "background", Token("bg")),
+    ("TRadiobutton", "configure", "foreground", Token("fg")),
+    ("TRadiobutton", "configure", "indicatorcolor", Token("surface")),
+    ("TRadiobutton", "configure", "padding", 5),
+    ("TRadiobutton", "map", "indicatorcolor",
+     States(("selected", Token("accent")), ("active", Token("hover")))),
+    ("TRadiobutton", "map", "background", States(("active", Token("bg")))),
+    ("Card.TRadiobutton", "configure", "background", Token("surface")),
+    ("Card.TRadiobutton", "configure", "foreground", Token("fg")),
+
+    # Combobox
+    ("TCombobox", "configure", "fieldbackground", Token("surface")),
+    ("TCombobox", "configure", "background", Token("surface")),
+    ("TCombobox", "configure", "foreground", Token("fg")),
+    ("TCombobox", "configure", "bordercolor", Token("border")),
+    ("TCombobox", "configure", "arrowcolor", Token("fg")),
+    ("TCombobox", "configure", "padding", 10),
+    ("TCombobox", "configure", "relief", "flat"),
+    ("TCombobox", "map", "fieldbackground",
+     States(("focus", Token("surface")), ("readonly", Token("surface")))),
+    ("TCombobox", "map", "bordercolor", States(("focus", Token("accent")))),
+    ("TCombobox", "map", "arrowcolor", States(("active", Token("accent")))),
+
+    # Progress bars
+    ("TProgressbar", "configure", "background", Token("accent")),
+    ("TProgressbar", "configure", "troughcolor", Token("surface")),
+    ("TProgressbar", "configure", "bordercolor", Token("border")),
+    ("TProgressbar", "configure", "lightcolor", Token("accent")),
+    ("TProgressbar", "configure", "darkcolor", Token("accent")),
+    ("TProgressbar", "configure", "thickness", 10),
+    ("Success.TProgressbar", "configure", "background", Token("success")),
+    ("Success.TProgressbar", "configure", "troughcolor", Token("surface")),
+    ("Warning.TProgressbar", "configure", "background", Token("warning")),
+    ("Warning.TProgressbar", "configure", "troughcolor", Token("surface")),
+    ("Error.TProgressbar", "configure", "background", Token("error")),
+    ("Error.TProgressbar", "configure", "troughcolor", Token("surface")),
+
+    # Scales and scrollbars
+    ("TScale", "configure", "background", Token("bg")),
+    ("TScale", "configure", "troughcolor", Token("surface")),
+    ("TScale", "configure", "bordercolor", Token("border")),
+    ("TScale", "configure", "sliderthickness", 20),
+    ("TScale", "configure", "sliderrelief", "flat"),
+    ("TScale", "map", "background", States(("active", Token("accent")))),
+    ("TScrollbar", "configure", "background", Token("surface_variant")),
+    ("TScrollbar", "configure", "troughcolor", Token("bg")),
+    ("TScrollbar", "configure", "bordercolor", Token("border")),
+    ("TScrollbar", "configure", "arrowcolor", Token("fg")),
+    ("TScrollbar", "configure", "relief", "flat"),
+    ("TScrollbar", "map", "background",
+     States(("active", Token("accent")), ("pressed", Token("accent")))),
+
+    # Notebook (tabs)
+    ("TNotebook", "configure", "background", Token("bg")),
+    ("TNotebook", "configure", "bordercolor", Token("border")),
+    ("TNotebook", "configure", "tabmargins", [2, 5, 2, 0]),
+    ("TNotebook", "configure", "borderwidth", 0),
+    ("TNotebook.Tab", "configure", "background", Token("surface")),
+    ("TNotebook.Tab", "configure", "foreground", Token("fg")),
+    ("TNotebook.Tab", "configure", "padding", [20, 10]),
+    ("TNotebook.Tab", "configure", "bordercolor", Token("border")),
+    ("TNotebook.Tab", "configure", "focuscolor", Token("accent")),
+    ("TNotebook.Tab", "map", "background",
+     States(("selected", Token("accent")), ("active", Token("hover")))),
+    ("TNotebook.Tab", "map", "foreground",
+     States(("selected", "#ffffff"), ("active", Token("fg")))),
+    ("TNotebook.Tab", "map", "expand", States(("selected", [1, 1, 1, 0]))),
+
+    # Separator
+    ("TSeparator", "configure", "background", Token("border")),
+
+    # Treeview
+    ("Treeview", "configure", "background", Token("surface")),
+    ("Treeview", "configure", "foreground", Token("fg")),
+    ("Treeview", "configure", "fieldbackground", Token("surface")),
+    ("Treeview", "configure", "borderwidth", 0),
+    ("Treeview", "configure", "relief", "flat"),
+    ("Treeview", "configure", "rowheight", 25),
+    ("Treeview", "map", "background", States(("selected", Token("accent")))),
+    ("Treeview", "map", "foreground", States(("selected", "#ffffff"))),
+    ("Treeview.Heading", "configure", "background", Token("surface_variant")),
+    ("Treeview.Heading", "configure", "foreground", Token("fg")),
+    ("Treeview.Heading", "configure", "borderwidth", 0),
+    ("Treeview.Heading", "configure", "relief", "flat"),
+    ("Treeview.Heading", "configure", "padding", (5, 5, 5, 5)),
+    ("Treeview.Heading", "map", "background",
+     States(("active", Token("hover")))),
+    ("Treeview.Heading", "map", "relief", States(("active", "groove"))),
+    ("Treeview.Item", "configure", "padding", (3, 3, 3, 3)),
+
+    # Sizegrip and panedwindow sash
+    ("Sizegrip", "layout", None, [("Sizegrip.sizegrip", {"sticky": "se"})]),
+    ("Sizegrip", "configure", "background", Token("surface_variant")),
+    ("Sizegrip", "configure", "relief", "flat"),
+    ("Sash", "configure", "background", Token("border")),
+    ("Sash", "configure", "relief", "flat"),
+
+    # Oriented scales
+    ("Horizontal.TScale", "configure", "background", Token("bg")),
+    ("Horizontal.TScale", "configure", "troughcolor",
+     Token("surface_variant")),
+    ("Horizontal.TScale", "configure", "bordercolor", Token("border")),
+    ("Horizontal.TScale", "configure", "sliderrelief", "flat"),
+    ("Horizontal.TScale", "configure", "sliderlength", 20),
+    ("Vertical.TScale", "configure", "background", Token("bg")),
+    ("Vertical.TScale", "configure", "troughcolor", Token("surface_variant")),
+    ("Vertical.TScale", "configure", "bordercolor", Token("border")),
+    ("Vertical.TScale", "configure", "sliderrelief", "flat"),
+    ("Vertical.TScale", "configure", "sliderlength", 20),
+
+    # Menubutton
+    ("TMenubutton", "configure", "background", Token("surface")),
+    ("TMenubutton", "configure", "foreground", Token("fg")),
+    ("TMenubutton", "configure", "borderwidth", 1),
+    ("TMenubutton", "configure", "bordercolor", Token("border")),
+    ("TMenubutton", "configure", "padding", (10, 5)),
+    ("TMenubutton", "configure", "relief", "flat"),
+    ("TMenubutton", "map", "background", States(("active", Token("hover")))),
+    ("TMenubutton", "map", "bordercolor", States(("active", Token("accent")))),
+
+    # Labelframe
+    ("TLabelframe", "configure", "background", Token("bg")),
+    ("TLabelframe", "configure", "foreground", Token("fg")),
+    ("TLabelframe", "configure", "bordercolor", Token("border")),
+    ("TLabelframe", "configure", "borderwidth", 1),
+    ("TLabelframe", "configure", "relief", "flat"),
+    ("TLabelframe.Label", "configure", "background", Token("bg")),
+    ("TLabelframe.Label", "configure", "foreground", Token("accent")),
+    ("TLabelframe.Label", "configure", "font", FONT_NAMES["body"]),
+
+    # Spinbox
+    ("TSpinbox", "configure", "fieldbackground", Token("surface")),
+    ("TSpinbox", "configure", "foreground", Token("fg")),
+    ("TSpinbox", "configure", "bordercolor", Token("border")),
+    ("TSpinbox", "configure", "arrowcolor", Token("fg")),
+    ("TSpinbox", "configure", "padding", 10),
+    ("TSpinbox", "configure", "relief", "flat"),
+    ("TSpinbox", "map", "fieldbackground",
+     States(("focus", Token("surface")))),
+    ("TSpinbox", "map", "bordercolor", States(("focus", Token("accent")))),
+    ("TSpinbox", "map", "arrowcolor", States(("active", Token("accent")))),
+]
+
+
+def _index_rows(table):
+    """Map (style, kind, option) to the row value, rejecting duplicates"""
+    rows = {}
+    for style, kind, option, value in table:
+        key = (style, kind, option)
+        if key in rows:
+            raise ValueError(f"Duplicate style table row: {key}")
+        rows[key] = value
+    return rows
+
+
+def _index_dependencies(rows):
+    """Map each token to the (style, kind, option) rows that read it"""
+    dependencies = {}
+    for key, value in rows.items():
+        for name in getattr(value, "tokens", ()):
+            dependencies.setdefault(name, set()).add(key)
+    return dependencies
+
+
+STYLE_ROWS = _index_rows(STYLE_TABLE)
+TOKEN_DEPENDENCIES = _index_dependencies(STYLE_ROWS)
+
+
+def dependent_rows(tokens):
+    """Return the (style, kind, option) rows that read any of the tokens"""
+    keys = set()
+    for name in tokens:
+        keys.update(TOKEN_DEPENDENCIES.get(name, ()))
+    return keys
+
+
+def resolve_style_table(theme, keys=None):
+    """
+    Resolve the style table for a theme
+
+    Args:
+        theme: Theme dictionary
+        keys: Optional collection of (style, kind, option) rows to resolve;
+            all rows when None
+
+    Returns:
+        Dictionary mapping (style, kind, option) to the resolved value, in
+        table order. Rows resolving to None are left out.
+    """
+    table = {}
+    for key, value in STYLE_ROWS.items():
+        if keys is not None and key not in keys:
+            continue
+        value = resolve_value(value, theme)
+        if value is not None:
+            table[key] = value
+    return table
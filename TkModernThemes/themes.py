@@ -0,0 +1,234 @@
+"""
+Built-in theme definitions for TkModernThemes
+
+This module is imported by the theme catalog the first time a built-in
+theme's tokens are needed; listing themes only uses the catalog index.
+"""
+
+# Enhanced theme definitions with PySide6 and Nexus UI inspiration
+BUILTIN_THEMES = {
+    "cyberpunk": {
+        "name": "Cyberpunk",
+        "bg": "#0a0a0f",
+        "fg": "#00ff9d",
+        "accent": "#ff2a6d",
+        "secondary": "#ff9d00",
+        "surface": "#151520",
+        "surface_variant": "#1e1e2e",
+        "border": "#2a2a40",
+        "hover": "#2a1a2e",
+        "success": "#00e6c7",
+        "warning": "#ffcc00",
+        "error": "#ff2a6d",
+        "font": ("Courier New", 10, "bold"),
+        "heading_font": ("Arial Black", 16, "bold"),
+        "radius": 6
+    },
+    "minimal_zen": {
+        "name": "Minimal Zen",
+        "bg": "#f8f9fa",
+        "fg": "#2d3436",
+        "accent": "#6c5ce7",
+        "secondary": "#a29bfe",
+        "surface": "#ffffff",
+        "surface_variant": "#f1f2f6",
+        "border": "#dfe6e9",
+        "hover": "#f1f2f6",
+        "success": "#00b894",
+        "warning": "#fdcb6e",
+        "error": "#ff7675",
+        "font": ("Inter", 9),
+        "heading_font": ("Inter", 16, "light"),
+        "radius": 4
+    },
+    "dark_pro": {
+        "name": "Dark Pro",
+        "bg": "#121212",
+        "fg": "#e0e0e0",
+        "accent": "#7c4dff",
+        "secondary": "#00bcd4",
+        "surface": "#1e1e1e",
+        "surface_variant": "#2d2d2d",
+        "border": "#3a3a3a",
+        "hover": "#2a2a2a",
+        "success": "#4caf50",
+        "warning": "#ff9800",
+        "error": "#f44336",
+        "font": ("Roboto", 9),
+        "heading_font": ("Roboto", 16, "medium"),
+        "radius": 6
+    },
+    "glassmorphism": {
+        "name": "Glassmorphism",
+        "bg": "#1e1e2e",  # Dark base color for glass effect
+        "fg": "#ffffff",
+        "accent": "#6366f1",
+        "secondary": "#8b5cf6",
+        "surface": "#2d2d3d80",  # Slightly lighter than bg for contrast with transparency
+        "surface_variant": "#3a3a4a80",  # Even lighter for hover states with transparency
+        "border": "#4a4a5a",  # Subtle border color
+        "hover": "#3a3a5a80",  # Slightly purple-tinged hover with transparency
+        "backdrop": "bg",  # Translucent colors are composited over bg
+        "success": "#10b981",
+        "warning": "#f59e0b",
+        "error": "#ef4444",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 16, "semibold"),
+        "radius": 16,
+        "blur": True  # Enable blur effect for glassmorphism
+    },
+    "neomorphism": {
+        "name": "Neomorphism",
+        "bg": "#e0e5ec",
+        "fg": "#4a4a4a",
+        "accent": "#5c6bc0",
+        "secondary": "#7e57c2",
+        "surface": "#e0e5ec",
+        "surface_variant": "#e4ebf5",
+        "border": "#d1d9e6",
+        "hover": "#f0f0f0",
+        "success": "#4caf50",
+        "warning": "#ff9800",
+        "error": "#f44336",
+        "font": ("Poppins", 9),
+        "heading_font": ("Poppins", 16, "medium"),
+        "radius": 12,
+        "shadow": "-6px -6px 12px #ffffff, 6px 6px 12px #a3b1c6"
+    },
+    "nexus_dark": {
+        "name": "Nexus Dark",
+        "bg": "#0a0a0a",
+        "fg": "#e4e4e7",
+        "accent": "#3b82f6",
+        "secondary": "#8b5cf6",
+        "surface": "#18181b",
+        "surface_variant": "#27272a",
+        "border": "#3f3f46",
+        "hover": "#1e293b",
+        "success": "#22c55e",
+        "warning": "#f59e0b",
+        "error": "#ef4444",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 16, "bold"),
+        "radius": 8
+    },
+    "nexus_light": {
+        "name": "Nexus Light",
+        "bg": "#ffffff",
+        "fg": "#18181b",
+        "accent": "#2563eb",
+        "secondary": "#7c3aed",
+        "surface": "#f4f4f5",
+        "surface_variant": "#e4e4e7",
+        "border": "#d4d4d8",
+        "hover": "#f1f5f9",
+        "success": "#16a34a",
+        "warning": "#ea580c",
+        "error": "#dc2626",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 16, "bold"),
+        "radius": 8
+    },
+    "pyside_fusion": {
+        "name": "PySide Fusion",
+        "bg": "#353535",
+        "fg": "#dddddd",
+        "accent": "#308cc6",
+        "secondary": "#9575cd",
+        "surface": "#3d3d3d",
+        "surface_variant": "#454545",
+        "border": "#5a5a5a",
+        "hover": "#4a4a4a",
+        "success": "#66bb6a",
+        "warning": "#ffa726",
+        "error": "#ef5350",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 14, "bold"),
+        "radius": 4
+    },
+    "material_deep": {
+        "name": "Material Deep",
+        "bg": "#121212",
+        "fg": "#e0e0e0",
+        "accent": "#bb86fc",
+        "secondary": "#03dac6",
+        "surface": "#1e1e1e",
+        "surface_variant": "#2c2c2c",
+        "border": "#383838",
+        "hover": "#272727",
+        "success": "#4caf50",
+        "warning": "#ffb74d",
+        "error": "#cf6679",
+        "font": ("Roboto", 9),
+        "heading_font": ("Roboto", 16, "bold"),
+        "radius": 12
+    },
+    "fluent_dark": {
+        "name": "Fluent Dark",
+        "bg": "#202020",
+        "fg": "#ffffff",
+        "accent": "#0078d4",
+        "secondary": "#8961d6",
+        "surface": "#2b2b2b",
+        "surface_variant": "#363636",
+        "border": "#414141",
+        "hover": "#323232",
+        "success": "#107c10",
+        "warning": "#ff8c00",
+        "error": "#d13438",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 16, "bold"),
+        "radius": 4
+    },
+    "fluent_light": {
+        "name": "Fluent Light",
+        "bg": "#f3f3f3",
+        "fg": "#000000",
+        "accent": "#0067c0",
+        "secondary": "#744da9",
+        "surface": "#ffffff",
+        "surface_variant": "#f9f9f9",
+        "border": "#d1d1d1",
+        "hover": "#f5f5f5",
+        "success": "#0e700e",
+        "warning": "#ff8c00",
+        "error": "#c42b1c",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 16, "bold"),
+        "radius": 4
+    },
+    "cyber_nexus": {
+        "name": "Cyber Nexus",
+        "bg": "#0d0d0f",
+        "fg": "#00ffff",
+        "accent": "#ff00ff",
+        "secondary": "#00ff00",
+        "surface": "#1a1a1f",
+        "surface_variant": "#25252e",
+        "border": "#ff00ff",
+        "hover": "#2d2d3a",
+        "success": "#00ff88",
+        "warning": "#ffaa00",
+        "error": "#ff0055",
+        "font": ("Consolas", 9),
+        "heading_font": ("Consolas", 16, "bold"),
+        "radius": 0
+    },
+    "nord_frost": {
+        "name": "Nord Frost",
+        "bg": "#2e3440",
+        "fg": "#eceff4",
+        "accent": "#88c0d0",
+        "secondary": "#81a1c1",
+        "surface": "#3b4252",
+        "surface_variant": "#434c5e",
+        "border": "#4c566a",
+        "hover": "#434c5e",
+        "success": "#a3be8c",
+        "warning": "#ebcb8b",
+        "error": "#bf616a",
+        "font": ("Segoe UI", 9),
+        "heading_font": ("Segoe UI", 16, "bold"),
+        "radius": 6
+    }
+}
@@ -0,0 +1,118 @@
+"""
+Import-time budget for TkModernThemes
+
+Runs each import statement of SCENARIOS in a fresh interpreter under
+``python -X importtime`` and sums the self time of every module the
+statement imports beyond a bare interpreter start. The median of --runs
+is checked against the scenario budget, and the scenario fails if it
+imports one of its forbidden modules (which would mean a lazy submodule
+is loaded too early).
+
+Budgets:
+
+- ``import TkModernThemes``: 25 ms, without tkinter, the ttk engine, the
+  demo, the animation helpers or the built-in theme definitions
+- ``from TkModernThemes import ThemedTk``: 60 ms, without the demo, the
+  animation helpers or the built-in theme definitions
+- ``from TkModernThemes.modern_themes import ModernThemes``: 30 ms,
+  without CustomTkinter or tkinter
+- loading the CustomTkinter backend (what the first ``ModernThemes(...)``
+  does): 400 ms; skipped when CustomTkinter is not installed
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20 --output import.json
+
+The exit status is 1 if a scenario is over budget or imports a
+forbidden module. No display is needed.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LAZY = ("TkModernThemes.demo", "TkModernThemes.animation", "TkModernThemes.themes")
+
+# statement -> (budget in ms, modules it must not import, module the
+# scenario needs installed or None)
+SCENARIOS = {
+    "import TkModernThemes": (
+        25, ("tkinter", "TkModernThemes.engine") + _LAZY, None),
+    "from TkModernThemes import ThemedTk": (60, _LAZY, None),
+    "from TkModernThemes.modern_themes import ModernThemes": (
+        30, ("customtkinter", "tkinter", "TkModernThemes.engine"), None),
+    "from TkModernThemes.modern_themes import _backend; _backend()": (
+        400, ("TkModernThemes.engine",) + _LAZY, "customtkinter"),
+}
+
+
+def import_times(statement):
+    """Run statement under -X importtime and return {module: self us}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def measure(statement, runs, startup):
+    """Measure one scenario; startup holds the modules of a bare start"""
+    totals = []
+    for _ in range(runs):
+        times = {name: us for name, us in import_times(statement).items()
+                 if name not in startup}
+        totals.append(sum(times.values()) / 1000)
+    slowest = sorted(times.items(), key=lambda item: -item[1])[:5]
+    return {
+        "median_ms": statistics.median(totals),
+        "min_ms": min(totals),
+        "modules": sorted(times),
+        "slowest": [[name, us / 1000] for name, us in slowest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7,
+                        help="fresh interpreters per scenario (default: 7)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    startup = set(import_times("pass"))
+    failed = False
+    results = {}
+    for statement, (budget, forbidden, needs) in SCENARIOS.items():
+        if needs is not None and importlib.util.find_spec(needs) is None:
+            print(f"{statement:40} skipped ({needs} is not installed)")
+            continue
+        result = results[statement] = measure(statement, args.runs, startup)
+        loaded = [name for name in forbidden if name in result["modules"]]
+        over = result["median_ms"] > budget
+        failed = failed or over or bool(loaded)
+        status = "OVER BUDGET" if over else "ok"
+        print(f"{statement:40} {result['median_ms']:7.1f} ms "
+              f"(budget {budget} ms, {len(result['modules'])} modules) {status}")
+        for name, ms in result["slowest"]:
+            print(f"    {name:36} {ms:6.1f} ms")
+        if loaded:
+            print(f"    imports forbidden modules: {', '.join(loaded)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results},
+                      f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
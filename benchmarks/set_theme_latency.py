@@ -0,0 +1,154 @@
+"""
+set_theme latency suite for TkModernThemes
+
+For every theme and widget tree size, measures:
+
+- cold set_theme: first switch to the theme in a fresh interpreter with
+  empty caches (each tree size runs in its own Python process with an
+  empty TKMT_CACHE_DIR, so no size reuses the color, font or compiled
+  theme caches of another)
+- warm set_theme: later switches to the same theme (median of --rounds)
+- the first update_idletasks() after each switch, reported separately
+
+Results are written as JSON so runs of different versions can be compared:
+
+    python benchmarks/set_theme_latency.py --output new.json
+    python benchmarks/set_theme_latency.py --compare old.json
+
+Without a DISPLAY the script re-runs itself under xvfb-run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TkModernThemes as TKMT  # noqa: E402
+from theme_switch import build_widgets  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+def ensure_display(use_xvfb):
+    """Re-exec under xvfb-run when there is no X display"""
+    if not use_xvfb or sys.platform != "linux" or os.environ.get("DISPLAY"):
+        return
+    xvfb_run = shutil.which("xvfb-run")
+    if xvfb_run is None:
+        sys.exit("No DISPLAY and xvfb-run not found; install Xvfb or pass --no-xvfb")
+    os.execv(xvfb_run, [xvfb_run, "-a", sys.executable] + sys.argv)
+
+
+def timed(func):
+    """Run func and return its wall time in milliseconds"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_size(widget_count, rounds):
+    """Measure every theme against a tree of widget_count widgets"""
+    root = tk.Tk()
+    root.withdraw()
+    build_widgets(root, widget_count)
+    root.update_idletasks()
+    theme = TKMT.ThemedTk(root)
+    names = theme.get_theme_list()
+
+    results = {name: {"warm_ms": [], "warm_idle_ms": []} for name in names}
+    for name in names:
+        results[name]["cold_ms"] = timed(lambda: theme.set_theme(name))
+        results[name]["cold_idle_ms"] = timed(root.update_idletasks)
+
+    for _ in range(rounds):
+        for name in names:
+            results[name]["warm_ms"].append(timed(lambda: theme.set_theme(name)))
+            results[name]["warm_idle_ms"].append(timed(root.update_idletasks))
+
+    root.destroy()
+    for entry in results.values():
+        for key in ("warm_ms", "warm_idle_ms"):
+            samples = entry.pop(key)
+            entry[key] = statistics.median(samples) if samples else None
+    return results
+
+
+def measure_size_cold(widget_count, rounds):
+    """Run measure_size in a fresh process with an empty on-disk cache"""
+    with tempfile.TemporaryDirectory() as cache:
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker",
+             str(widget_count), "--rounds", str(rounds)],
+            env=dict(os.environ, TKMT_CACHE_DIR=cache),
+            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def run(sizes, rounds):
+    """Run the whole suite and return a JSON-serialisable report"""
+    return {
+        "version": TKMT.__version__,
+        "python": platform.python_version(),
+        "tk": tk.TkVersion,
+        "platform": platform.platform(),
+        "rounds": rounds,
+        "results": {str(size): measure_size_cold(size, rounds) for size in sizes},
+    }
+
+
+def compare(report, baseline):
+    """Print new/old timing ratios of report against baseline"""
+    print(f"{'widgets':>8} {'theme':<16}{'cold':>10}{'warm':>10}{'idle':>10}")
+    for size, themes in report["results"].items():
+        for name, entry in themes.items():
+            old = baseline.get("results", {}).get(size, {}).get(name)
+            if old is None:
+                continue
+            ratios = []
+            for key in ("cold_ms", "warm_ms", "cold_idle_ms"):
+                ratios.append(entry[key] / old[key] if old.get(key) else float("nan"))
+            print(f"{size:>8} {name:<16}" + "".join(f"{r:>9.2f}x" for r in ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="widget tree sizes (default: 100 1000 10000)")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="warm switches measured per theme (default: 5)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="print ratios against a previous JSON report")
+    parser.add_argument("--no-xvfb", dest="xvfb", action="store_false",
+                        help="never re-exec under xvfb-run")
+    parser.add_argument("--worker", type=int, metavar="SIZE", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        # One tree size, run by measure_size_cold in a fresh process
+        json.dump(measure_size(args.worker, args.rounds), sys.stdout)
+        return
+    ensure_display(args.xvfb)
+    report = run(args.sizes, args.rounds)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
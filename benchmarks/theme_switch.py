@@ -0,0 +1,80 @@
+"""
+Theme switch benchmark for TkModernThemes
+
+Compares the first switch to each theme (which builds its ttk theme)
+with later switches to the same theme (a single theme_use call).
+
+Run with: python benchmarks/theme_switch.py [--widgets N] [--rounds N]
+Needs a display; on headless machines use: xvfb-run -a python ...
+"""
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import TkModernThemes as TKMT  # noqa: E402
+
+
+def build_widgets(root, count):
+    """Populate root with roughly count ttk widgets"""
+    frame = ttk.Frame(root)
+    frame.pack(fill=tk.BOTH, expand=True)
+    kinds = (ttk.Label, ttk.Button, ttk.Entry, ttk.Checkbutton)
+    for i in range(count):
+        kind = kinds[i % len(kinds)]
+        if kind is ttk.Entry:
+            widget = kind(frame)
+        else:
+            widget = kind(frame, text=f"Widget {i}")
+        widget.grid(row=i // 10, column=i % 10)
+
+
+def run(widget_count, rounds):
+    """Measure first and later switches for every theme"""
+    root = tk.Tk()
+    root.withdraw()
+    build_widgets(root, widget_count)
+    theme = TKMT.ThemedTk(root)
+    themes = theme.get_theme_list()
+
+    first = {}
+    later = {name: [] for name in themes}
+    for name in themes:
+        start = time.perf_counter()
+        theme.set_theme(name)
+        root.update_idletasks()
+        first[name] = time.perf_counter() - start
+
+    for _ in range(rounds):
+        for name in themes:
+            start = time.perf_counter()
+            theme.set_theme(name)
+            root.update_idletasks()
+            later[name].append(time.perf_counter() - start)
+
+    root.destroy()
+
+    print(f"{'theme':<16}{'first (ms)':>12}{'later (ms)':>12}{'speedup':>10}")
+    for name in themes:
+        warm = min(later[name]) if later[name] else float("nan")
+        print(f"{name:<16}{first[name] * 1000:>12.2f}{warm * 1000:>12.2f}"
+              f"{first[name] / warm if warm else float('nan'):>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--widgets", type=int, default=2000,
+                        help="number of ttk widgets to create (default: 2000)")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="later switches measured per theme (default: 5)")
+    args = parser.parse_args()
+    run(args.widgets, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,39 @@ Comprehensive Test Suite for TkModernThemes
 This test suite validates the functionality of the TkModernThemes library.
 """
 
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
 import tkinter as tk
 from tkinter import ttk
 import unittest
+from unittest import mock
 import TkModernThemes as TKMT
 
 
-class TestTkModernThemes(unittest.TestCase):
+class _TempCacheDir:
+    """Point TKMT_CACHE_DIR at a temporary directory for each test"""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.dict(
+            os.environ, {"TKMT_CACHE_DIR": os.path.join(self.tmp.name, "cache")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestTkModernThemes(_TempCacheDir, unittest.TestCase):
     """Test suite for TkModernThemes library"""
     
     def setUp(self):
         """Set up test fixtures"""
+        super().setUp()
         self.root = tk.Tk()
         self.root.withdraw()  # Hide the window during testing
         self.theme_manager = TKMT.ThemedTk(self.root)
@@ -53,6 +75,261 @@ class TestTkModernThemes(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.theme_manager.set_theme("invalid_theme_name")
     
+    def test_set_theme_compiles_ttk_theme_once(self):
+        """Test that each theme gets its own ttk theme, built on first use"""
+        self.theme_manager.set_theme("nord_frost")
+        self.theme_manager.set_theme("cyberpunk")
+        self.assertIn("tkmt_nord_frost", self.theme_manager.style.theme_names())
+        self.assertIn("tkmt_cyberpunk", self.theme_manager.style.theme_names())
+
+        # Switching back reuses the compiled ttk theme
+        self.theme_manager.set_theme("nord_frost")
+        self.assertEqual(self.theme_manager.style.theme_use(), "tkmt_nord_frost")
+        self.assertEqual(self.theme_manager.style.lookup("TFrame", "background"),
+                         TKMT.THEMES["nord_frost"]["bg"])
+    
+    def test_theme_script_cached(self):
+        """Test that a theme compiles to one cached ttk::style script"""
+        self.theme_manager.set_theme("dark_pro")
+        token_hash = TKMT.engine._token_hash(TKMT.THEMES["dark_pro"])
+        script = TKMT.engine._theme_cache.get(("dark_pro", token_hash)).script
+        self.assertTrue(self.root.tk.call("info", "complete", script))
+        self.assertIn("ttk::style theme settings tkmt_dark_pro", script)
+    
+    def test_update_theme_colors_invalidates_cache(self):
+        """Test that token updates recompile the theme"""
+        self.theme_manager.set_theme("fluent_light")
+        original = TKMT.THEMES["fluent_light"]["accent"]
+        misses = self.theme_manager.cache_info().misses
+        try:
+            self.theme_manager.update_theme_colors(accent="#123456")
+            self.assertEqual(self.theme_manager.cache_info().misses, misses + 1)
+            self.assertEqual(self.theme_manager.style.lookup("TButton", "background"),
+                             "#123456")
+        finally:
+            self.theme_manager.update_theme_colors(accent=original)
+    
+    def test_set_theme_applies_only_changed_options(self):
+        """Test that recompiling a theme only rewrites changed options"""
+        self.theme_manager.set_theme("pyside_fusion")
+        total = self.theme_manager.last_apply_stats.applied
+        original = TKMT.THEMES["pyside_fusion"]["warning"]
+        try:
+            self.theme_manager.update_theme_colors(warning="#abcdef")
+            stats = self.theme_manager.last_apply_stats
+            self.assertGreater(stats.applied, 0)
+            self.assertEqual(stats.applied + stats.skipped, total)
+            self.assertLess(stats.applied, stats.skipped)
+        finally:
+            self.theme_manager.update_theme_colors(warning=original)
+
+    def test_update_resets_removed_rows(self):
+        """Test that options a theme no longer sets fall back to the parent style"""
+        self.theme_manager.set_theme("neomorphism")
+        style = self.theme_manager.style
+        original = TKMT.THEMES["neomorphism"]["shadow"]
+        self.assertEqual(str(style.lookup("Card.TFrame", "padding")), "10 10 10 10")
+        try:
+            self.theme_manager.update_theme_colors(shadow="")
+            self.assertEqual(style.lookup("Card.TFrame", "padding"),
+                             style.lookup("TFrame", "padding"))
+            self.assertEqual(style.lookup("Card.TFrame", "bordercolor"),
+                             TKMT.THEMES["neomorphism"]["border"])
+        finally:
+            self.theme_manager.update_theme_colors(shadow=original)
+    
+    def test_token_dependencies(self):
+        """Test that token updates only touch the options using the token"""
+        self.theme_manager.set_theme("nexus_dark")
+        theme = TKMT.THEMES["nexus_dark"]
+        deps = TKMT.styles.TOKEN_DEPENDENCIES
+        self.assertIn(("Accent.TButton", "map", "background"), deps["accent"])
+        self.assertIn(("TEntry", "map", "bordercolor"), deps["accent"])
+        self.assertIn(("TNotebook.Tab", "map", "background"), deps["accent"])
+        self.assertNotIn(("TButton", "configure", "background"), deps["fg"])
+
+        original = theme["accent"]
+        try:
+            self.theme_manager.update_theme_colors(accent="#00aa00")
+            self.assertEqual(self.theme_manager.last_apply_stats.applied,
+                             len(deps["accent"]))
+        finally:
+            self.theme_manager.update_theme_colors(accent=original)
+    
+    def test_batch_updates_apply_once(self):
+        """Test that batched color updates reapply the theme once"""
+        self.theme_manager.set_theme("material_deep")
+        theme = TKMT.THEMES["material_deep"]
+        original = {key: theme[key] for key in ("bg", "fg", "accent")}
+        try:
+            with self.theme_manager.batch():
+                self.theme_manager.update_theme_colors(bg="#101010")
+                self.theme_manager.update_theme_colors(fg="#f0f0f0")
+                self.theme_manager.update_theme_colors(accent="#ff5500")
+                # Nothing is reapplied inside the block
+                self.assertEqual(self.theme_manager.style.lookup("TFrame", "background"),
+                                 original["bg"])
+            self.assertEqual(self.theme_manager.reapplies_avoided, 2)
+            self.assertEqual(self.theme_manager.style.lookup("TFrame", "background"),
+                             "#101010")
+            self.assertEqual(self.theme_manager.style.lookup("TButton", "background"),
+                             "#ff5500")
+        finally:
+            self.theme_manager.update_theme_colors(**original)
+    
+    def test_profiling_report(self):
+        """Test that profiling counts Tcl calls per style"""
+        report = self.theme_manager.enable_profiling(max_slowest=3)
+        try:
+            self.theme_manager.set_theme("fluent_dark")
+            card = self.theme_manager.create_card(self.root)
+        finally:
+            self.assertIs(self.theme_manager.disable_profiling(), report)
+        self.assertIs(card.tk, self.root.tk)
+        self.assertIs(self.theme_manager.style.tk, self.root.tk)
+        self.assertGreater(report.commands, 0)
+        self.assertIn("TButton", report.style_times)
+        self.assertIn("Card.TFrame", report.style_commands)
+        self.assertLessEqual(len(report.slowest), 3)
+        self.assertEqual(report.as_dict()["commands"], report.commands)
+
+    def test_profiling_counts_font_updates(self):
+        """Test that the named font updates of a theme switch are profiled"""
+        self.theme_manager.set_theme("fluent_dark")
+        report = self.theme_manager.enable_profiling(max_slowest=1000)
+        self.theme_manager.set_theme("cyberpunk")
+        self.theme_manager.disable_profiling()
+        self.assertTrue(any(call.command.startswith("font configure TkmtBody")
+                            for call in report.slowest))
+
+    def test_managers_share_engine(self):
+        """Test that managers on one interpreter share compiled themes"""
+        self.theme_manager.set_theme("material_deep")
+        window = tk.Toplevel(self.root)
+        try:
+            other = TKMT.ThemedTk(window)
+            self.assertIs(other._engine, self.theme_manager._engine)
+            other.set_theme("material_deep")
+            self.assertEqual(other.last_apply_stats.applied, 0)
+            self.assertEqual(window.cget("bg"), TKMT.THEMES["material_deep"]["bg"])
+            # Switching the active theme again is a no-op
+            report = other.enable_profiling()
+            other.set_theme("material_deep")
+            self.assertEqual(report.commands, 1)
+        finally:
+            window.destroy()
+
+    def test_destroyed_roots_release_engines(self):
+        """Test that engines and schedulers go away with their Tk root"""
+        engines = len(TKMT.engine._engines)
+        schedulers = len(TKMT.animation._schedulers)
+        for _ in range(3):
+            root = tk.Tk()
+            root.withdraw()
+            TKMT.ThemedTk(root).set_theme("nexus_dark")
+            TKMT.animation.scheduler_for(root)
+            root.destroy()
+        del root
+        gc.collect()
+        self.assertEqual(len(TKMT.engine._engines), engines)
+        self.assertEqual(len(TKMT.animation._schedulers), schedulers)
+
+    def test_tk_color_name_background(self):
+        """Test that a Tk color name works as the root background"""
+        TKMT.THEMES["named_bg"] = dict(TKMT.THEMES["nord_frost"], bg="white")
+        try:
+            self.theme_manager.set_theme("named_bg")
+            self.assertEqual(self.root.cget("bg"), "white")
+            self.assertEqual(self.theme_manager.style.lookup("TFrame", "background"),
+                             "white")
+        finally:
+            del TKMT.THEMES["named_bg"]
+
+    def test_set_theme_keeps_tokens(self):
+        """Test that applying a theme does not rewrite its tokens"""
+        before = dict(TKMT.THEMES["glassmorphism"])
+        self.theme_manager.set_theme("glassmorphism")
+        self.assertEqual(TKMT.THEMES["glassmorphism"], before)
+
+    def test_named_fonts(self):
+        """Test that styles use named fonts reconfigured per theme"""
+        self.theme_manager.set_theme("cyberpunk")
+        self.assertEqual(str(self.theme_manager.style.lookup("TButton", "font")),
+                         "TkmtBody")
+        heading = self.theme_manager.fonts["heading"]
+        self.assertEqual(heading.actual("size"), 16)
+        self.theme_manager.set_theme("pyside_fusion")
+        self.assertEqual(heading.cget("size"), 14)
+        self.assertEqual(heading.cget("family"),
+                         TKMT.fonts.FontResolver(self.root).resolve("Segoe UI"))
+
+    def test_theme_transition(self):
+        """Test that a transition interpolates colors and ends on the new theme"""
+        self.theme_manager.set_theme("nexus_dark")
+        transition = TKMT.animate_theme_transition(
+            self.theme_manager, "nexus_light", duration=100, steps=5)
+        self.assertIn("bg", transition.gradients)
+        self.assertNotIn("font", transition.gradients)
+        self.assertEqual(self.theme_manager.style.theme_use(), "tkmt__transition")
+        scheduler = TKMT.animation.scheduler_for(self.root)
+        while scheduler.animations:
+            self.root.update()
+        self.assertTrue(transition.finished)
+        self.assertLessEqual(transition.rendered + transition.dropped, 6)
+        self.assertEqual(self.theme_manager.current_theme, "nexus_light")
+        self.assertEqual(self.theme_manager.style.theme_use(), "tkmt_nexus_light")
+        self.assertIsNone(TKMT.animate_theme_transition(self.theme_manager, "nexus_light"))
+
+    def test_transition_retargets(self):
+        """Test that a second transition continues from the colors shown"""
+        self.theme_manager.set_theme("nexus_dark")
+        first = TKMT.animate_theme_transition(self.theme_manager, "nexus_light",
+                                              duration=1000)
+        self.root.after(100)
+        self.root.update()
+        second = TKMT.animate_theme_transition(self.theme_manager, "nexus_dark",
+                                               duration=50)
+        self.assertTrue(first.cancelled)
+        self.assertEqual(second.start_colors, first.colors)
+        scheduler = TKMT.animation.scheduler_for(self.root)
+        while scheduler.animations:
+            self.root.update()
+        self.assertEqual(self.theme_manager.style.theme_use(), "tkmt_nexus_dark")
+        self.assertEqual(self.root.cget("bg"), TKMT.THEMES["nexus_dark"]["bg"])
+
+        # set_theme with the current theme, mid-transition
+        TKMT.animate_theme_transition(self.theme_manager, "nexus_light",
+                                      duration=1000)
+        self.root.after(100)
+        self.root.update()
+        self.theme_manager.set_theme("nexus_dark")
+        self.assertEqual(self.root.cget("bg"), TKMT.THEMES["nexus_dark"]["bg"])
+        scheduler.stop()
+
+    def test_transition_theme_reset(self):
+        """Test that a transition does not show rows left by an earlier one"""
+        scheduler = TKMT.animation.scheduler_for(self.root)
+        self.theme_manager.set_theme("neomorphism")
+        TKMT.animate_theme_transition(self.theme_manager, "nexus_dark", duration=50)
+        while scheduler.animations:
+            self.root.update()
+        TKMT.animate_theme_transition(self.theme_manager, "cyberpunk", duration=50)
+        style = self.theme_manager.style
+        self.assertEqual(style.theme_use(), "tkmt__transition")
+        self.assertEqual(style.lookup("Card.TFrame", "padding"),
+                         style.lookup("TFrame", "padding"))
+        scheduler.stop()
+
+    def test_destroy_cancels_animations(self):
+        """Test that destroying a widget cancels its animations"""
+        label = tk.Label(self.root)
+        TKMT.animate_widget(label, "background", "#000000", "#ffffff", duration=1000)
+        TKMT.animate_widget(label, "width", 0, 10, duration=1000)
+        scheduler = TKMT.animation.scheduler_for(label)
+        self.assertEqual(len(scheduler.animations), 2)
+        label.destroy()
+        self.assertEqual(scheduler.animations, [])
+
     def test_get_current_theme(self):
         """Test getting the current theme"""
         self.theme_manager.set_theme("cyberpunk")
@@ -124,11 +401,12 @@ class TestTkModernThemes(unittest.TestCase):
         self.assertEqual(reset_colors["bg"], original_bg)
 
 
-class TestWidgetStyling(unittest.TestCase):
+class TestWidgetStyling(_TempCacheDir, unittest.TestCase):
     """Test that widgets are properly styled"""
     
     def setUp(self):
         """Set up test fixtures"""
+        super().setUp()
         self.root = tk.Tk()
         self.root.withdraw()  # Hide the window during testing
         self.theme_manager = TKMT.ThemedTk(self.root)
@@ -165,6 +443,642 @@ class TestWidgetStyling(unittest.TestCase):
         self.assertIsInstance(entry, ttk.Entry)
 
 
+class TestTclQuoting(unittest.TestCase):
+    """Test Tcl quoting used by the theme compiler (no display needed)"""
+
+    def setUp(self):
+        self.tcl = tk.Tcl()
+
+    def test_tcl_word_round_trip(self):
+        """Test that quoted words parse back to the original value"""
+        for value in ["#ffffff", "Segoe UI", "", "{x", "x}", "a\\", "$x", 'a"b',
+                      "b\\{\t$]}", "b] \n\\\n", "{a\\}b}"]:
+            with self.subTest(value=value):
+                word = TKMT.engine._tcl_word(value)
+                self.assertEqual(self.tcl.eval(f"lindex [list {word}] 0"), value)
+
+    def test_tcl_word_nested_lists(self):
+        """Test that tuples become Tcl lists"""
+        word = TKMT.engine._tcl_word(("Segoe UI", 9, "bold"))
+        self.assertEqual(self.tcl.tk.splitlist(self.tcl.eval(f"lindex [list {word}] 0")),
+                         ("Segoe UI", "9", "bold"))
+
+
+class TestThemeCache(unittest.TestCase):
+    """Test the compiled theme cache (no display needed)"""
+
+    def test_lru_eviction_and_counters(self):
+        """Test that the least recently used entry is evicted"""
+        cache = TKMT.engine._ThemeCache(maxsize=2)
+        cache.put(("a", "1"), "A")
+        cache.put(("b", "1"), "B")
+        self.assertEqual(cache.get(("a", "1")), "A")
+        cache.put(("c", "1"), "C")
+        self.assertIsNone(cache.get(("b", "1")))
+        self.assertEqual(cache.info(), TKMT.CacheInfo(1, 1, 2, 2))
+
+    def test_invalidate_theme(self):
+        """Test that invalidation drops every hash of a theme"""
+        cache = TKMT.engine._ThemeCache()
+        cache.put(("a", "1"), "A1")
+        cache.put(("a", "2"), "A2")
+        cache.put(("b", "1"), "B")
+        cache.invalidate("a")
+        self.assertEqual(cache.info().currsize, 1)
+
+    def test_settings_from_table(self):
+        """Test grouping (style, kind, option) rows into theme settings"""
+        table = {("TButton", "configure", "padding"): (16, 8),
+                 ("TButton", "map", "background"): [("active", "#fff")],
+                 ("TFrame", "layout", None): [("Frame.border", {"sticky": "nswe"})]}
+        self.assertEqual(TKMT.engine._settings_from_table(table), {
+            "TButton": {"configure": {"padding": (16, 8)},
+                        "map": {"background": [("active", "#fff")]}},
+            "TFrame": {"layout": [("Frame.border", {"sticky": "nswe"})]}})
+
+    def test_removed_rows_inherit(self):
+        """Test that rows a table no longer sets are reset from the parent style"""
+        old = {("Card.TFrame", "configure", "padding"): (10, 10, 10, 10),
+               ("Card.TFrame", "map", "background"): [("active", "#fff")]}
+        removed = TKMT.engine._removed_rows(old, {})
+        script = TKMT.engine._compile_settings(
+            "tkmt_x", TKMT.engine._settings_from_table(removed))
+        self.assertIn("ttk::style configure Card.TFrame "
+                      "-padding [ttk::style lookup TFrame -padding]", script)
+        self.assertIn("ttk::style map Card.TFrame -background {}", script)
+
+    def test_token_hash_tracks_content(self):
+        """Test that the token hash changes with the theme content"""
+        theme = dict(TKMT.THEMES["nord_frost"])
+        before = TKMT.engine._token_hash(theme)
+        theme["accent"] = "#000000"
+        self.assertNotEqual(TKMT.engine._token_hash(theme), before)
+
+
+class TestStyleTable(unittest.TestCase):
+    """Test the declarative style table (no display needed)"""
+
+    def test_every_theme_resolves(self):
+        """Test that the table resolves for every built-in theme"""
+        for name, theme in TKMT.THEMES.items():
+            with self.subTest(theme=name):
+                table = TKMT.styles.resolve_style_table(theme)
+                self.assertEqual(table[("TButton", "configure", "background")],
+                                 theme["accent"])
+                self.assertEqual(table[("TFrame", "layout", None)][0][1]["border"],
+                                 str(theme["radius"]))
+
+    def test_shadow_cards_drop_border(self):
+        """Test the neomorphism card: padded, no border"""
+        table = TKMT.styles.resolve_style_table(TKMT.THEMES["neomorphism"])
+        self.assertEqual(table[("Card.TFrame", "configure", "borderwidth")], 0)
+        self.assertEqual(table[("Card.TFrame", "configure", "padding")], (10, 10, 10, 10))
+        self.assertNotIn(("Card.TFrame", "configure", "bordercolor"), table)
+
+    def test_partial_resolution(self):
+        """Test resolving only the rows that read a token"""
+        rows = TKMT.styles.dependent_rows({"success"})
+        table = TKMT.styles.resolve_style_table(TKMT.THEMES["dark_pro"], rows)
+        self.assertEqual(set(table), rows)
+        self.assertIn(("Success.TButton", "map", "background"), rows)
+        self.assertIn(("Success.TProgressbar", "configure", "background"), rows)
+
+    def test_button_states_use_palette(self):
+        """Test that button pressed and disabled colors are palette shades"""
+        theme = TKMT.colors.normalize_theme(TKMT.THEMES["nexus_dark"])
+        palette = TKMT.palette.derive_palette(theme)
+        table = TKMT.styles.resolve_style_table(theme)
+        self.assertEqual(table[("TButton", "map", "background")],
+                         [("active", palette["accent"]["hover"]),
+                          ("pressed", palette["accent"]["pressed"]),
+                          ("disabled", palette["accent"]["disabled"])])
+        self.assertEqual(table[("Secondary.TButton", "map", "background")],
+                         [("active", theme["hover"]),
+                          ("pressed", palette["surface"]["pressed"])])
+
+    def test_tk_color_names_pass_through(self):
+        """Test that Tk color names are used as they are, without shades"""
+        theme = dict(TKMT.THEMES["nord_frost"], bg="white", success="green")
+        table = TKMT.styles.resolve_style_table(TKMT.colors.normalize_theme(theme))
+        self.assertEqual(table[("TFrame", "configure", "background")], "white")
+        self.assertEqual(table[("Success.TButton", "map", "background")][0],
+                         ("active", "green"))
+
+
+class TestColors(unittest.TestCase):
+    """Test color parsing and normalization (no display needed)"""
+
+    def test_parse_formats(self):
+        """Test every supported color notation"""
+        self.assertEqual(TKMT.colors.parse_color("#abc"), (170, 187, 204, 255))
+        self.assertEqual(TKMT.colors.parse_color("#0A0A0F"), (10, 10, 15, 255))
+        self.assertEqual(TKMT.colors.parse_color("#2d2d3d80"), (45, 45, 61, 128))
+        self.assertEqual(TKMT.colors.parse_color("rgb(255, 0, 64)"), (255, 0, 64, 255))
+        self.assertEqual(TKMT.colors.parse_color("rgba(10, 20, 30, 0.5)"), (10, 20, 30, 128))
+
+    def test_invalid_colors(self):
+        """Test that non-colors are rejected"""
+        for value in ("Inter", "#12", "#gggggg", "rgb(1, 2)", 10):
+            with self.subTest(value=value):
+                self.assertFalse(TKMT.colors.is_color(value))
+                with self.assertRaises(ValueError):
+                    TKMT.colors.parse_color(value)
+
+    def test_normalize_theme(self):
+        """Test that every color token becomes #rrggbb without mutation"""
+        theme = {"bg": "#FFF", "accent": "rgba(255, 42, 109, 0.8)",
+                 "surface": "#2d2d3d80", "font": ("Inter", 10), "name": "Test"}
+        before = dict(theme)
+        normalized = TKMT.colors.normalize_theme(theme)
+        self.assertEqual(theme, before)
+        # Translucent colors are composited over bg
+        self.assertEqual(normalized, {"bg": "#ffffff", "accent": "#ff558a",
+                                      "surface": "#96969e", "font": ("Inter", 10),
+                                      "name": "Test"})
+
+    def test_declared_backdrop(self):
+        """Test compositing over a declared backdrop token"""
+        theme = {"bg": "#ffffff", "surface": "#000000",
+                 "hover": "#ffffff80", "backdrop": {"hover": "surface"}}
+        self.assertEqual(TKMT.colors.normalize_theme(theme)["hover"], "#808080")
+        self.assertEqual(TKMT.colors.affected_tokens(theme, {"surface"}),
+                         {"surface", "hover"})
+        self.assertEqual(TKMT.colors.affected_tokens(theme, {"bg"}), {"bg"})
+
+
+class TestPalette(unittest.TestCase):
+    """Test the derived OKLab palette (no display needed)"""
+
+    def test_oklab_round_trip(self):
+        """Test sRGB -> OKLab -> sRGB conversion"""
+        L, a, b = TKMT.palette.to_oklab("#ffffff")
+        self.assertAlmostEqual(L, 1.0, places=4)
+        for color in ("#000000", "#ff2a6d", "#3b82f6", "#0a0a0f", "#f0f0f0"):
+            with self.subTest(color=color):
+                self.assertEqual(
+                    TKMT.palette.from_oklab(TKMT.palette.to_oklab(color)), color)
+
+    def test_shade_direction(self):
+        """Test that shades move away from the background"""
+        lightness = lambda color: TKMT.palette.to_oklab(color)[0]
+        dark = TKMT.palette.variant("#3b82f6", "#0a0a0a", "hover")
+        light = TKMT.palette.variant("#3b82f6", "#ffffff", "hover")
+        self.assertGreater(lightness(dark), lightness("#3b82f6"))
+        self.assertLess(lightness(light), lightness("#3b82f6"))
+        self.assertEqual(TKMT.palette.variant("#ffffff", "#000000", "disabled"),
+                         TKMT.palette.mix("#ffffff", "#000000", 0.6))
+
+    def test_derive_palette_memoized(self):
+        """Test that a theme's palette is derived once"""
+        theme = TKMT.colors.normalize_theme(TKMT.THEMES["nord_frost"])
+        palette = TKMT.palette.derive_palette(theme)
+        self.assertIs(TKMT.palette.derive_palette(dict(theme)), palette)
+        self.assertEqual(set(palette["accent"]), set(TKMT.palette.VARIANTS))
+        self.assertNotIn("font", palette)
+
+    def test_gradient(self):
+        """Test color interpolation tables in both color spaces"""
+        rgb = TKMT.palette.gradient("#ff0000", "rgb(0, 0, 255)", 2, "rgb")
+        self.assertEqual(rgb, ("#ff0000", "#800080", "#0000ff"))
+        oklab = TKMT.palette.gradient("#000000", "#ffffff", 4)
+        self.assertEqual((oklab[0], oklab[-1]), ("#000000", "#ffffff"))
+        lightness = [TKMT.palette.to_oklab(color)[0] for color in oklab]
+        steps = [b - a for a, b in zip(lightness, lightness[1:])]
+        self.assertAlmostEqual(min(steps), max(steps), places=2)
+        self.assertIs(TKMT.palette.gradient("#000000", "#ffffff", 4), oklab)
+        with self.assertRaises(ValueError):
+            TKMT.palette.gradient("#000000", "#ffffff", 4, "hsv")
+
+
+class TestFonts(unittest.TestCase):
+    """Test named font options (no display needed)"""
+
+    def test_font_options(self):
+        """Test mapping theme font tokens onto Tk font options"""
+        options = TKMT.fonts.font_options(TKMT.THEMES["glassmorphism"])
+        self.assertEqual(options["body"]["family"], "Segoe UI")
+        self.assertEqual(options["body"]["size"], 9)
+        # Tk has no semibold; it maps onto bold
+        self.assertEqual(options["heading"]["weight"], "bold")
+        self.assertEqual(options["small"]["size"], 8)
+        self.assertEqual(options["mono"]["size"], 9)
+
+    def test_light_weight(self):
+        """Test that light weights fall back to normal"""
+        options = TKMT.fonts.font_options({"font": ("Inter", 9),
+                                           "heading_font": ("Inter", 16, "light")})
+        self.assertEqual(options["heading"]["weight"], "normal")
+
+
+class TestFontResolver(_TempCacheDir, unittest.TestCase):
+    """Test font family fallback and its caches (Tcl only, no display)"""
+
+    FAMILIES = "{DejaVu Sans} {Noto Sans} {DejaVu Sans Mono}"
+
+    def setUp(self):
+        super().setUp()
+        TKMT.fonts._resolved.clear()
+
+    def tearDown(self):
+        TKMT.fonts._resolved.clear()
+
+    def make_root(self):
+        """Tcl interpreter with a stand-in font command counting enumerations"""
+        root = tk.Tcl()
+        root.tk.eval("set ::enumerations 0\n"
+                     "proc font {cmd args} {\n"
+                     "    if {$cmd eq \"families\"} {incr ::enumerations; "
+                     f"return {{{self.FAMILIES}}}}}\n"
+                     "    return {DejaVu Sans}\n"
+                     "}")
+        return root
+
+    def test_fallback_chain(self):
+        """Test resolving missing families through the chains"""
+        resolver = TKMT.fonts.FontResolver(self.make_root())
+        self.assertEqual(resolver.resolve("noto sans"), "Noto Sans")
+        self.assertEqual(resolver.resolve("Segoe UI"), "Noto Sans")
+        self.assertEqual(resolver.resolve("Consolas"), "DejaVu Sans Mono")
+        self.assertEqual(resolver.resolve("Wingdings"), "DejaVu Sans")
+        self.assertEqual(resolver.resolve("Courier", monospace=True),
+                         "DejaVu Sans Mono")
+
+    def test_disk_cache_skips_enumeration(self):
+        """Test that a cold start reuses the on-disk resolutions"""
+        root = self.make_root()
+        resolver = TKMT.fonts.FontResolver(root)
+        resolver.resolve("Segoe UI")
+        resolver.flush()
+        self.assertEqual(root.tk.eval("set ::enumerations"), "1")
+
+        TKMT.fonts._resolved.clear()
+        root = self.make_root()
+        self.assertEqual(TKMT.fonts.FontResolver(root).resolve("Segoe UI"),
+                         "Noto Sans")
+        self.assertEqual(root.tk.eval("set ::enumerations"), "0")
+
+
+class TestThemeFiles(_TempCacheDir, unittest.TestCase):
+    """Test loading themes from JSON files (no display needed)"""
+
+    def setUp(self):
+        super().setUp()
+        self.tokens = dict(TKMT.THEMES["nord_frost"], name="Brand Dark",
+                           accent="#ff5500")
+
+    def tearDown(self):
+        TKMT.THEMES.pop("brand_dark", None)
+
+    def write_theme(self, tokens):
+        path = os.path.join(self.tmp.name, "brand_dark.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(tokens, f)
+        return path
+
+    def test_load_registers_theme(self):
+        """Test that a theme file is validated and added to THEMES"""
+        name, theme = TKMT.load_theme_file(self.write_theme(self.tokens))
+        self.assertEqual(name, "brand_dark")
+        self.assertIs(TKMT.THEMES["brand_dark"], theme)
+        self.assertEqual(theme["font"], tuple(self.tokens["font"]))
+        script, rows = TKMT.loader.precompiled_script(name, TKMT.engine._token_hash(theme))
+        self.assertIn("tkmt_brand_dark", script)
+        self.assertEqual(rows, len(TKMT.styles.resolve_style_table(
+            TKMT.colors.normalize_theme(theme))))
+
+    def test_same_contents_different_names(self):
+        """Test that the file name is the default theme name even when cached"""
+        path = self.write_theme(self.tokens)
+        other = os.path.join(self.tmp.name, "brand_copy.json")
+        with open(path, "rb") as f, open(other, "wb") as copy:
+            copy.write(f.read())
+        try:
+            self.assertEqual(TKMT.load_theme_file(path)[0], "brand_dark")
+            name, _ = TKMT.load_theme_file(other)
+            self.assertEqual(name, "brand_copy")
+            script, _ = TKMT.loader.precompiled_script(
+                name, TKMT.engine._token_hash(TKMT.THEMES[name]))
+            self.assertIn("tkmt_brand_copy", script)
+        finally:
+            TKMT.THEMES.pop("brand_copy", None)
+
+    def test_cached_load_skips_validation(self):
+        """Test that an unchanged file is loaded from the cache"""
+        path = self.write_theme(self.tokens)
+        _, theme = TKMT.load_theme_file(path)
+        validate = TKMT.loader.validate_theme
+        TKMT.loader.validate_theme = None  # would fail if called
+        try:
+            self.assertEqual(TKMT.load_theme_file(path)[1], theme)
+        finally:
+            TKMT.loader.validate_theme = validate
+
+    def test_invalid_files(self):
+        """Test the errors for missing tokens and bad values"""
+        del self.tokens["accent"]
+        with self.assertRaisesRegex(TKMT.ThemeFileError, "missing tokens: accent"):
+            TKMT.load_theme_file(self.write_theme(self.tokens))
+        self.tokens["accent"] = "orange-ish"
+        with self.assertRaisesRegex(TKMT.ThemeFileError, "accent is not a color"):
+            TKMT.load_theme_file(self.write_theme(self.tokens))
+        self.tokens["accent"] = "#ff5500"
+        for theme_id in ("", 7, ["brand"]):
+            with self.subTest(id=theme_id):
+                with self.assertRaisesRegex(TKMT.ThemeFileError, "id must be"):
+                    TKMT.load_theme_file(self.write_theme(dict(self.tokens, id=theme_id)))
+        self.assertNotIn("brand_dark", TKMT.THEMES)
+
+
+class TestThemeCatalog(_TempCacheDir, unittest.TestCase):
+    """Test the lazy theme catalog (no display needed)"""
+
+    def test_builtin_index_matches_definitions(self):
+        """Test that the built-in index agrees with the theme literals"""
+        themes = TKMT.themes.BUILTIN_THEMES
+        self.assertEqual(list(TKMT.catalog.BUILTIN_INDEX), list(themes))
+        for name, (display_name, dark) in TKMT.catalog.BUILTIN_INDEX.items():
+            with self.subTest(theme=name):
+                self.assertEqual(display_name, themes[name]["name"])
+                self.assertEqual(dark, TKMT.palette.is_dark_color(themes[name]["bg"]))
+
+    def test_loads_on_first_access(self):
+        """Test that listing does not load and indexing loads once"""
+        catalog = TKMT.catalog.ThemeCatalog.builtin()
+        self.assertEqual(len(catalog), 13)
+        self.assertIn("nord_frost", catalog)
+        self.assertEqual(list(catalog)[0], "cyberpunk")
+        self.assertFalse(catalog.is_loaded("nord_frost"))
+        theme = catalog["nord_frost"]
+        self.assertTrue(catalog.is_loaded("nord_frost"))
+        self.assertIs(catalog["nord_frost"], theme)
+        self.assertFalse(catalog.is_loaded("cyberpunk"))
+
+    def test_directory_index(self):
+        """Test indexing theme files without loading them"""
+        tokens = dict(TKMT.THEMES["minimal_zen"], name="Paper")
+        with open(os.path.join(self.tmp.name, "paper.json"), "w") as f:
+            json.dump(tokens, f)
+        catalog = TKMT.catalog.ThemeCatalog()
+        self.assertEqual(catalog.add_directory(self.tmp.name), ["paper"])
+        entry = catalog.entry("paper")
+        self.assertEqual((entry.display_name, entry.dark), ("Paper", False))
+        self.assertFalse(catalog.is_loaded("paper"))
+        self.assertEqual(catalog["paper"]["font"], tuple(tokens["font"]))
+
+    def test_invalid_directory_files(self):
+        """Test that unreadable index data raises ThemeFileError naming the file"""
+        path = os.path.join(self.tmp.name, "broken.json")
+        catalog = TKMT.catalog.ThemeCatalog()
+        for contents, message in (("{", "invalid JSON"),
+                                  ("[1, 2]", "a theme file must hold a JSON object"),
+                                  ('{"id": 3}', "id must be")):
+            with self.subTest(contents=contents):
+                with open(path, "w") as f:
+                    f.write(contents)
+                with self.assertRaisesRegex(TKMT.ThemeFileError,
+                                            f"broken.json: {message}"):
+                    catalog.add_directory(self.tmp.name)
+        self.assertEqual(len(catalog), 0)
+
+    def test_set_and_delete(self):
+        """Test adding themes directly, as with a dict"""
+        catalog = TKMT.catalog.ThemeCatalog()
+        catalog["mine"] = dict(TKMT.THEMES["dark_pro"], name="Mine")
+        self.assertEqual(catalog.entry("mine").display_name, "Mine")
+        self.assertTrue(catalog.entry("mine").dark)
+        del catalog["mine"]
+        self.assertNotIn("mine", catalog)
+        with self.assertRaises(KeyError):
+            catalog["mine"]
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that submodules load on first use (no display needed)"""
+
+    def loaded_modules(self, statement):
+        code = f"{statement}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True,
+            text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        return set(output.split())
+
+    def test_package_import_is_light(self):
+        """Test that importing the package loads no ttk, demo or themes"""
+        modules = self.loaded_modules("import TkModernThemes")
+        for name in ("tkinter", "TkModernThemes.engine", "TkModernThemes.demo",
+                     "TkModernThemes.animation", "TkModernThemes.themes"):
+            self.assertNotIn(name, modules)
+
+    def test_attribute_loads_submodule(self):
+        """Test that lazy attributes resolve to their submodule objects"""
+        modules = self.loaded_modules("from TkModernThemes import ThemedTk")
+        self.assertIn("TkModernThemes.engine", modules)
+        self.assertNotIn("TkModernThemes.demo", modules)
+        self.assertIs(TKMT.ThemedTk, TKMT.engine.ThemedTk)
+        self.assertIs(TKMT.create_demo, TKMT.demo.create_demo)
+        self.assertIn("animate_widget", dir(TKMT))
+        with self.assertRaises(AttributeError):
+            TKMT.no_such_attribute
+
+    def test_modern_themes_without_customtkinter(self):
+        """Test that the CustomTkinter backend shares themes and loads lazily"""
+        modules = self.loaded_modules("import TkModernThemes.modern_themes")
+        self.assertNotIn("customtkinter", modules)
+        self.assertNotIn("tkinter", modules)
+
+        from TkModernThemes import modern_themes
+        theme = modern_themes.THEMES["cyberpunk"]
+        self.assertEqual(theme["accent"], TKMT.THEMES["cyberpunk"]["accent"])
+        self.assertEqual(theme["font"], ("Courier New", 12, "bold"))
+        self.assertTrue(modern_themes.THEMES.entry("cyberpunk").dark)
+
+
+class TestEasing(unittest.TestCase):
+    """Test the sampled easing curves (no display needed)"""
+
+    def test_tables(self):
+        """Test that every curve runs from 0 to 1 and is sampled once"""
+        for name in TKMT.easing.EASINGS:
+            with self.subTest(easing=name):
+                table = TKMT.easing.easing_table(name, 20)
+                self.assertEqual(len(table), 21)
+                self.assertAlmostEqual(table[0], 0.0)
+                self.assertEqual(table[-1], 1.0)
+                self.assertIs(TKMT.easing.easing_table(name, 20), table)
+        self.assertLess(min(TKMT.easing.easing_table("ease_in_back", 20)), 0)
+        self.assertGreater(max(TKMT.easing.easing_table("spring", 20)), 1)
+
+    def test_custom_and_unknown(self):
+        """Test callables as easings and errors for unknown names"""
+        table = TKMT.easing.easing_table(lambda t: t * t, 4)
+        self.assertEqual(table, (0.0, 0.0625, 0.25, 0.5625, 1.0))
+        with self.assertRaises(ValueError):
+            TKMT.easing.easing_table("bounce", 4)
+
+
+class _RecordingWidget:
+    """Stands in for a widget of a Tcl-only interpreter"""
+
+    def __init__(self, root):
+        self.root = root
+        self.options = []
+
+    def _root(self):
+        return self.root
+
+    def configure(self, **options):
+        self.options.append(options)
+
+
+class TestAnimationScheduler(unittest.TestCase):
+    """Test the shared animation frame clock (no display needed)"""
+
+    def setUp(self):
+        self.root = tk.Tcl()
+        self.scheduler = TKMT.animation.scheduler_for(_RecordingWidget(self.root))
+
+    def run_animations(self):
+        while self.scheduler.animations:
+            self.root.tk.dooneevent()
+
+    def test_one_timer_drives_all_animations(self):
+        """Test that concurrent animations share frames and finish on the end value"""
+        widgets = [_RecordingWidget(self.root) for _ in range(20)]
+        animations = [TKMT.animate_widget(widget, "width", 0, 100, duration=100, steps=10)
+                      for widget in widgets]
+        self.assertIs(TKMT.animation.scheduler_for(widgets[0]), self.scheduler)
+        commands = len(self.root.tk.call("info", "commands"))
+        self.run_animations()
+        self.assertEqual(len(self.root.tk.call("info", "commands")), commands)
+        self.assertTrue(all(animation.finished for animation in animations))
+        for widget in widgets:
+            self.assertLessEqual(len(widget.options), self.scheduler.frames)
+            self.assertEqual(widget.options[-1], {"width": 100})
+
+    def test_frame_applies_options_together(self):
+        """Test that properties of one widget are configured in one call"""
+        widget = _RecordingWidget(self.root)
+        TKMT.animate_widget(widget, "width", 0, 10, duration=50, steps=5)
+        TKMT.animate_widget(widget, "height", 10, 0, duration=50, steps=5)
+        self.run_animations()
+        self.assertLessEqual(len(widget.options), self.scheduler.frames)
+        self.assertIn({"width": 0, "height": 10}, widget.options)
+        final = {}
+        for options in widget.options:
+            final.update(options)
+        self.assertEqual(final, {"width": 10, "height": 0})
+
+    def test_color_animation(self):
+        """Test that colors animate through a shared lookup table"""
+        widget = _RecordingWidget(self.root)
+        animation = TKMT.animate_widget(widget, "background", "#000000", "#ffffff",
+                                        duration=50, steps=5, color_space="rgb")
+        self.assertIs(animation.values,
+                      TKMT.palette.gradient("#000000", "#ffffff", 5, "rgb"))
+        self.run_animations()
+        values = [options["background"] for options in widget.options]
+        self.assertTrue(set(values) <= set(animation.values))
+        self.assertEqual(values[-1], "#ffffff")
+
+    def test_color_names(self):
+        """Test that Tk color names are resolved through the widget"""
+        class NamedColorWidget(_RecordingWidget):
+            def winfo_rgb(self, color):
+                if color != "SystemButtonFace":
+                    raise tk.TclError(f'unknown color name "{color}"')
+                return (0xf0f0, 0xf0f0, 0xf0f0)
+
+        widget = NamedColorWidget(self.root)
+        animation = TKMT.animate_widget(widget, "background", "SystemButtonFace",
+                                        "#000000", duration=0, steps=4)
+        self.assertEqual(animation.values[0], "#f0f0f0")
+        with self.assertRaisesRegex(ValueError, "not a number or a color"):
+            TKMT.animate_widget(widget, "background", "#000000", "nocolor")
+        with self.assertRaisesRegex(ValueError, "not a number or a color"):
+            TKMT.animate_widget(_RecordingWidget(self.root), "background",
+                                "white", "#000000")
+
+    def test_same_property_retargets(self):
+        """Test that a new animation of a property replaces the running one"""
+        widget = _RecordingWidget(self.root)
+        first = TKMT.animate_widget(widget, "width", 0, 100, duration=1000, steps=100)
+        height = TKMT.animate_widget(widget, "height", 0, 10, duration=1000)
+        for _ in range(3):
+            self.root.tk.dooneevent()
+        shown = first.last_value
+        self.assertIsNotNone(shown)
+        second = TKMT.animate_widget(widget, "width", 100, 0, duration=50, steps=5)
+        self.assertTrue(first.cancelled)
+        self.assertIs(self.scheduler.running(widget, "width"), second)
+        self.assertEqual(second.values[0], shown)
+        self.assertEqual(len(self.scheduler.animations), 2)
+
+        self.assertEqual(TKMT.animation.cancel_animations(widget), 2)
+        self.assertTrue(height.cancelled)
+        self.assertIsNone(self.scheduler.running(widget, "width"))
+
+    def test_eased_values(self):
+        """Test that eased animations precompute their values from the table"""
+        widget = _RecordingWidget(self.root)
+        table = TKMT.easing.easing_table("ease_out_back", 10)
+        animation = TKMT.animate_widget(widget, "width", 0, 100, steps=10,
+                                        easing="ease_out_back")
+        self.assertEqual(animation.values, [100 * progress for progress in table])
+        self.assertGreater(max(animation.values), 100)
+
+        colors = TKMT.animate_widget(widget, "background", "#000000", "#ffffff",
+                                     steps=10, easing="ease_out_back")
+        lut = TKMT.palette.gradient("#000000", "#ffffff", 10)
+        self.assertTrue(set(colors.values) <= set(lut))
+        self.assertEqual(colors.values[-1], "#ffffff")
+        self.scheduler.stop()
+
+    def test_frame_stats(self):
+        """Test interval, late frame and overrun accounting"""
+        stats = TKMT.animation.FrameStats()
+        for now in (0.0, 0.016, 0.032, 0.100, 0.116):
+            stats.record_frame(now, 16)
+        self.assertEqual(stats.frames, 5)
+        self.assertEqual(stats.late_frames, 1)
+        self.assertEqual(stats.dropped_frames, 3)
+        self.assertAlmostEqual(stats.mean_interval, 29)
+        self.assertAlmostEqual(stats.max_interval, 68)
+        stats.pause()
+        self.assertIsNone(stats.record_frame(10.0, 16))
+        stats.record_finish(500, 520)
+        stats.record_finish(500, 490)
+        self.assertEqual((stats.animations, stats.total_overrun), (2, 20))
+        self.assertEqual(stats.as_dict()["late_frames"], 1)
+
+    def test_late_frames_reported(self):
+        """Test that a slow frame shows up in the animation and scheduler stats"""
+        class SlowWidget(_RecordingWidget):
+            def configure(self, **options):
+                super().configure(**options)
+                if len(self.options) == 2:
+                    time.sleep(0.06)
+
+        late = []
+        self.scheduler.on_late_frame = late.append
+        widget = SlowWidget(self.root)
+        animation = TKMT.animate_widget(widget, "width", 0, 100, duration=200, steps=20)
+        self.run_animations()
+        self.assertGreaterEqual(animation.stats.late_frames, 1)
+        self.assertGreaterEqual(late[0], 60)
+        self.assertEqual(animation.stats.animations, 1)
+        self.assertGreaterEqual(animation.stats.total_overrun, 0)
+        self.assertIs(TKMT.animation.animation_stats(widget), self.scheduler.stats)
+        self.assertGreaterEqual(self.scheduler.stats.late_frames, 1)
+
+    def test_cancel(self):
+        """Test that cancelling the last animation stops the timer"""
+        widget = _RecordingWidget(self.root)
+        animation = TKMT.animate_widget(widget, "width", 0, 10, duration=1000)
+        self.scheduler.cancel(animation)
+        self.assertEqual(self.scheduler.animations, [])
+        self.assertEqual(self.root.tk.call("after", "info"), "")
+
+
 def run_tests():
     """Run all tests"""
     # Create a test suite